@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Sequence, Set, Tuple, Union
+
+from .errors import G2PError
+from .models import G2PResult
+
+if TYPE_CHECKING:
+    from .api import G2P
+
+_Pending = Tuple[str, "asyncio.Future[G2PResult]"]
+
+
+class AsyncG2P:
+    """Asyncio front end that micro-batches concurrent conversions.
+
+    Texts awaited at about the same time are grouped into batches of at most
+    ``max_batch_size`` and converted with ``G2P.convert_batch`` on
+    ``executor``. At most ``max_concurrency`` batches run at once and at most
+    ``max_pending`` texts wait for a batch; further callers wait for room.
+    """
+
+    def __init__(
+        self,
+        converter: G2P,
+        *,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 1,
+        max_batch_size: int = 32,
+        max_delay: float = 0.002,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative")
+        if max_pending is None:
+            max_pending = max_batch_size * max_concurrency * 4
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive")
+        self._converter = converter
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="g2p-mix")
+        self._max_concurrency = max_concurrency
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._max_pending = max_pending
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._batches: Set[asyncio.Task] = set()
+        self._closed = False
+
+    async def __aenter__(self) -> AsyncG2P:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def __call__(self, text: str) -> G2PResult:
+        if not isinstance(text, str):
+            raise TypeError("text must be a string")
+        if self._closed:
+            raise RuntimeError("AsyncG2P is closed")
+        self._start()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def convert_batch(self, texts: Sequence[str]) -> List[Union[G2PResult, G2PError]]:
+        """Convert texts in input order; a failed text yields its ``G2PError``."""
+
+        texts = tuple(texts)
+        if any(not isinstance(text, str) for text in texts):
+            raise TypeError("texts must contain only strings")
+        results = await asyncio.gather(*(self(text) for text in texts), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, G2PError):
+                raise result
+        return results
+
+    async def aclose(self) -> None:
+        """Finish queued conversions, then release an executor this instance created."""
+
+        if self._closed:
+            return
+        self._closed = True
+        if self._dispatcher is not None:
+            await self._queue.put(None)
+            await self._dispatcher
+            if self._batches:
+                await asyncio.gather(*self._batches)
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._max_pending)
+            self._slots = asyncio.Semaphore(self._max_concurrency)
+            self._dispatcher = loop.create_task(self._dispatch())
+        elif self._loop is not loop:
+            raise RuntimeError("AsyncG2P is bound to a different event loop")
+
+    async def _dispatch(self) -> None:
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            if self._max_delay and self._queue.qsize() < self._max_batch_size - 1:
+                await asyncio.sleep(self._max_delay)
+            while len(batch) < self._max_batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._slots.acquire()
+            task = self._loop.create_task(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: List[_Pending]) -> None:
+        try:
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                return
+            try:
+                results = await self._loop.run_in_executor(
+                    self._executor,
+                    self._converter.convert_batch,
+                    [text for text, _ in batch],
+                )
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, G2PError):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            self._slots.release()
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import Literal
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Sequence, Tuple, TypeVar, Union
 
 from .backends import (
     EnglishBackend,
@@ -10,15 +19,32 @@ from .backends import (
     PypinyinBackend,
     ToJyutpingBackend,
 )
-from .errors import ConfigurationError
+from .cache import CacheInfo, LruCache, SingleFlight, SqliteResultCache
+from .errors import ConfigurationError, G2PError
+from .instrumentation import StageHook
 from .models import G2PResult, PhoneAlphabet, UnknownPolicy
 from .pipeline import G2PPipeline
 from .profiles import CantoneseProfile, EnglishProfile, MandarinProfile
+from .resources import (
+    LoadState,
+    ResourceLoader,
+    WarmupReport,
+    WarmupStep,
+    component_warmup_steps,
+    resource_fingerprint,
+)
 from .similarity import PhoneticMatcher, SimilarityResult
+from .text.document import DocumentSource, iter_sentences, split_sentences
+from .validation import ValidationStats
 
 Mode = Literal["mandarin", "cantonese"]
 Output = Literal["native", "ipa"]
 Unknown = Literal["strict", "preserve"]
+Validation = Literal["full", "sampled", "off"]
+Normalization = Literal["full", "windowed"]
+Executor = Literal["process", "thread"]
+Deduplicate = Literal["exact", "normalized"]
+T = TypeVar("T")
 
 _CHINESE_BACKENDS = {
     "mandarin": {
@@ -37,6 +63,46 @@ _DEFAULT_BACKENDS = {
 _ENGLISH_BACKENDS = {
     "g2p-en": EnglishBackend,
 }
+_worker_converter: Optional["G2P"] = None
+
+
+def _initialize_worker(config: Dict[str, Any]) -> None:
+    global _worker_converter
+
+    _worker_converter = G2P(**config)
+    # A failed load is reported again by every conversion that needs the resource.
+    _worker_converter.warmup()
+
+
+def _convert_in_worker(texts: Sequence[str], deduplicate: Deduplicate) -> List[Union[G2PResult, G2PError]]:
+    return _worker_converter.convert_batch(texts, deduplicate=deduplicate)
+
+
+def _component_fingerprint(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int)):
+        return value
+    identity = f"{type(value).__module__}.{type(value).__qualname__}"
+    fingerprint = getattr(value, "fingerprint", None)
+    return f"{identity}:{fingerprint()}" if callable(fingerprint) else identity
+
+
+def _checked_texts(texts: Sequence[str], deduplicate: Deduplicate) -> Tuple[str, ...]:
+    texts = tuple(texts)
+    if any(not isinstance(text, str) for text in texts):
+        raise TypeError("texts must contain only strings")
+    if deduplicate not in {"exact", "normalized"}:
+        raise ConfigurationError("deduplicate must be 'exact' or 'normalized'")
+    return texts
+
+
+def _deduplicated(texts: Sequence[str], convert: Callable[[Sequence[str]], List[T]]) -> List[T]:
+    """Convert each distinct text once and fan the results out to every position."""
+
+    unique = tuple(dict.fromkeys(texts))
+    if len(unique) == len(texts):
+        return convert(texts)
+    converted = dict(zip(unique, convert(unique)))
+    return [converted[text] for text in texts]
 
 
 class G2P:
@@ -53,6 +119,15 @@ class G2P:
         unknown: Unknown = "strict",
         tone_sandhi: bool = True,
         traditional: bool = True,
+        normalization: Normalization = "full",
+        cache_size: int = 0,
+        cache_path: Optional[Union[str, os.PathLike]] = None,
+        normalized_cache_size: int = 0,
+        validation: Validation = "full",
+        validation_interval: int = 100,
+        on_stage: Optional[StageHook] = None,
+        background_load: bool = False,
+        coalesce: bool = False,
     ) -> None:
         if mode not in _CHINESE_BACKENDS:
             raise ConfigurationError("mode must be 'mandarin' or 'cantonese'")
@@ -62,6 +137,19 @@ class G2P:
             unknown_policy = UnknownPolicy(unknown)
         except ValueError as error:
             raise ConfigurationError("unknown must be 'strict' or 'preserve'") from error
+        if normalization not in {"full", "windowed"}:
+            raise ConfigurationError("normalization must be 'full' or 'windowed'")
+        if not isinstance(cache_size, int) or isinstance(cache_size, bool) or cache_size < 0:
+            raise ConfigurationError("cache_size must be a non-negative integer")
+        if (
+            not isinstance(normalized_cache_size, int)
+            or isinstance(normalized_cache_size, bool)
+            or normalized_cache_size < 0
+        ):
+            raise ConfigurationError("normalized_cache_size must be a non-negative integer")
+        self._loader = ResourceLoader(self._warmup_steps)
+        # Results served by the fallback while the primary loads must not be cached as the primary's.
+        self._fallback_gated = background_load and fallback_backend is not None
 
         chinese_backend = self._resolve_backend(
             mode,
@@ -74,19 +162,44 @@ class G2P:
                 fallback_backend,
                 unknown_policy=UnknownPolicy.STRICT,
             )
-            chinese_backend = FallbackBackend(chinese_backend, fallback)
+            chinese_backend = FallbackBackend(
+                chinese_backend,
+                fallback,
+                primary_ready=self._load_finished if background_load else None,
+            )
         resolved_english_backend = self._resolve_english_backend(english_backend)
         if mode == "mandarin":
             chinese = MandarinProfile(
                 backend=chinese_backend,
                 tone_sandhi=tone_sandhi,
+                windowed_normalization=normalization == "windowed",
             )
         else:
             chinese = CantoneseProfile(
                 backend=chinese_backend,
                 traditional=traditional,
+                windowed_normalization=normalization == "windowed",
             )
 
+        self._config = {
+            "mode": mode,
+            "output": output,
+            "backend": backend,
+            "fallback_backend": fallback_backend,
+            "english_backend": english_backend,
+            "unknown": unknown,
+            "tone_sandhi": tone_sandhi,
+            "traditional": traditional,
+            "normalization": normalization,
+            "cache_size": cache_size,
+            "cache_path": cache_path,
+            "normalized_cache_size": normalized_cache_size,
+            "validation": validation,
+            "validation_interval": validation_interval,
+            "on_stage": on_stage,
+            "background_load": background_load,
+            "coalesce": coalesce,
+        }
         self.mode = mode
         self.output = output
         self.backend = chinese_backend.name
@@ -95,11 +208,387 @@ class G2P:
             chinese=chinese,
             english=EnglishProfile.for_backend(resolved_english_backend),
             output_alphabet=PhoneAlphabet.IPA if output == "ipa" else None,
+            validation=validation,
+            validation_interval=validation_interval,
+            on_stage=on_stage,
+            normalized_cache_size=normalized_cache_size,
+            cache_ready=self._load_finished if self._fallback_gated else None,
         )
         self._matcher = None
+        self._cache: Optional[LruCache[G2PResult]] = LruCache(cache_size) if cache_size else None
+        self._store: Optional[SqliteResultCache[G2PResult]] = None
+        if cache_path is not None:
+            unidentified = [
+                key
+                for key in ("backend", "fallback_backend", "english_backend")
+                if self._config[key] is not None
+                and not isinstance(self._config[key], str)
+                and not callable(getattr(self._config[key], "fingerprint", None))
+            ]
+            if unidentified:
+                raise ConfigurationError(
+                    f"cache_path requires backend objects that define fingerprint(): {', '.join(unidentified)}"
+                )
+            self._store = SqliteResultCache(cache_path, self.fingerprint())
+        self._in_flight: Optional[SingleFlight[G2PResult]] = SingleFlight() if coalesce else None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._pool_lock = Lock()
+        if background_load:
+            self._loader.start()
+
+    def __enter__(self) -> "G2P":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes of :meth:`map` and close the ``cache_path`` file.
+
+        Closing twice is harmless. The converter stays usable: a later ``map``
+        starts a new pool, but results are no longer read from or written to
+        ``cache_path``.
+        """
+
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+            store, self._store = self._store, None
+        if pool is not None:
+            pool.shutdown()
+        if store is not None:
+            store.close()
 
     def __call__(self, text: str) -> G2PResult:
-        return self._pipeline(text)
+        if self._in_flight is not None and isinstance(text, str):
+            # Concurrent callers with the same text share one conversion.
+            return self._in_flight.run(text, lambda: self._convert(text))
+        return self._convert(text)
+
+    def _convert(self, text: str) -> G2PResult:
+        if (self._cache is None and self._store is None) or not isinstance(text, str):
+            return self._pipeline(text)
+        return self._convert_cached((text,), lambda pending: [self._pipeline(value) for value in pending])[0]
+
+    def phones(self, text: str) -> Tuple[str, ...]:
+        """Return ``self(text).phones`` without building the structured result.
+
+        A result already in the ``cache_size`` cache is reused without counting
+        towards ``cache_info()``; nothing is stored, and ``cache_path`` is not
+        used.
+        """
+
+        if self._cache is not None and isinstance(text, str):
+            cached = self._cache.peek(text)
+            if cached is not None:
+                return cached.phones
+        return self._pipeline.phones(text)
+
+    def phones_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        deduplicate: Deduplicate = "exact",
+    ) -> List[Union[Tuple[str, ...], G2PError]]:
+        """Return the phones of each text in input order; a failed text yields its ``G2PError``."""
+
+        texts = _checked_texts(texts, deduplicate)
+        return _deduplicated(
+            texts,
+            partial(self._pipeline.phones_batch, deduplicate_normalized=deduplicate == "normalized"),
+        )
+
+    def warmup(self) -> WarmupReport:
+        """Load every resource this configuration needs and report each load's time and memory.
+
+        Resources that fail to load are listed with their error instead of
+        aborting the remaining loads.
+        """
+
+        return self._loader.load()
+
+    @property
+    def state(self) -> LoadState:
+        """Resource loading state: ``idle``, ``loading``, ``ready`` or ``failed``."""
+
+        return self._loader.state
+
+    @property
+    def warmup_report(self) -> Optional[WarmupReport]:
+        return self._loader.report
+
+    def ready(self) -> bool:
+        return self._loader.ready()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to ``timeout`` seconds for a started load and return whether it succeeded."""
+
+        return self._loader.wait_ready(timeout)
+
+    def _load_finished(self) -> bool:
+        return self._loader.state in {LoadState.READY, LoadState.FAILED}
+
+    def _warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        # Load what the fallback and the other stages need before a primary backend that is served around.
+        steps = self._pipeline.warmup_steps()
+        backend = self._pipeline.chinese.backend
+        if not isinstance(backend, FallbackBackend):
+            return steps
+        shared = {step[0] for step in component_warmup_steps(backend.fallback)}
+        primary = {step[0] for step in component_warmup_steps(backend.primary)} - shared
+        return tuple(step for step in steps if step[0] not in primary) + tuple(
+            step for step in steps if step[0] in primary
+        )
+
+    def convert_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        deduplicate: Deduplicate = "exact",
+    ) -> List[Union[G2PResult, G2PError]]:
+        """Convert texts in input order; a failed text yields its ``G2PError``.
+
+        Identical texts are converted once and share one result. With
+        ``deduplicate="normalized"``, texts that normalize to the same text
+        also share the analysis and prediction, with source spans re-projected
+        onto each text.
+        """
+
+        texts = _checked_texts(texts, deduplicate)
+        convert = partial(self._pipeline.convert_batch, deduplicate_normalized=deduplicate == "normalized")
+        if self._cache is None and self._store is None:
+            return _deduplicated(texts, convert)
+        return _deduplicated(texts, lambda unique: self._convert_cached(unique, convert))
+
+    def iter_document(self, source: DocumentSource, *, encoding: str = "utf-8") -> Iterator[G2PResult]:
+        """Convert a long document sentence by sentence, yielding one result per sentence.
+
+        ``source`` is a string, a text or binary file object, or an
+        ``os.PathLike`` path; files are memory-mapped or read in chunks, so
+        memory stays bounded by the longest sentence. Sentences end at
+        ``SENTENCE_MARKS``. Each result's ``original_text`` is its sentence,
+        while its source spans index the whole document.
+        """
+
+        for offset, sentence in iter_sentences(source, encoding):
+            yield self.convert(sentence, offset=offset)
+
+    def convert(self, text: str, *, offset: int = 0) -> G2PResult:
+        """Convert ``text`` like calling the converter, for text found at ``offset`` in a larger document.
+
+        The result's ``original_text`` is ``text``, while its source spans are
+        shifted by ``offset`` so they index the document.
+        """
+
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            raise ConfigurationError("offset must be a non-negative integer")
+        result = self(text)
+        if not offset:
+            return result
+        return self._pipeline.offset_result(result, source_offset=offset)
+
+    def fingerprint(self) -> str:
+        """Identify this configuration, the package version, and its resources for persistent caches.
+
+        Custom backend objects are identified by their class and, when they
+        define one, their own ``fingerprint()``.
+        """
+
+        config = {
+            key: _component_fingerprint(value)
+            for key, value in self._config.items()
+            if key
+            not in {
+                "cache_size",
+                "cache_path",
+                "normalized_cache_size",
+                "validation",
+                "validation_interval",
+                "on_stage",
+                "background_load",
+                "coalesce",
+            }
+        }
+        payload = json.dumps({"config": config, "resources": resource_fingerprint()}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit, miss and eviction counts of the ``cache_size`` result cache."""
+
+        if self._cache is None:
+            return CacheInfo(hits=0, misses=0, evictions=0, maxsize=0, size=0)
+        return self._cache.info()
+
+    def normalized_cache_info(self) -> CacheInfo:
+        """Return hit, miss and eviction counts of the ``normalized_cache_size`` analysis cache."""
+
+        return self._pipeline.normalized_cache_info()
+
+    def validation_stats(self) -> ValidationStats:
+        """Return how many conversions ran the contract checks and how many violated them."""
+
+        return self._pipeline.validation_stats()
+
+    def cache_clear(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+        self._pipeline.normalized_cache_clear()
+
+    def map(
+        self,
+        texts: Sequence[str],
+        *,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        deduplicate: Deduplicate = "exact",
+    ) -> List[Union[G2PResult, G2PError]]:
+        """Convert texts on a process pool and return results in input order.
+
+        Every worker builds its own ``G2P`` with this instance's configuration
+        and loads its resources once before converting chunks of ``chunksize``
+        texts with :meth:`convert_batch`. The pool is kept for later calls
+        with the same ``workers`` until :meth:`close`. Workers are spawned, so
+        custom backend objects must be picklable and importable. Result caches and the ``on_stage`` hook stay in this
+        process. Identical texts are sent to the workers once; ``deduplicate``
+        is passed on to :meth:`convert_batch`.
+        """
+
+        texts = _checked_texts(texts, deduplicate)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be positive")
+        convert = partial(self._map, workers=workers, chunksize=chunksize, deduplicate=deduplicate)
+        if self._cache is not None or self._store is not None:
+            return _deduplicated(texts, lambda unique: self._convert_cached(unique, convert))
+        return _deduplicated(texts, convert)
+
+    def _map(
+        self,
+        texts: Sequence[str],
+        workers: int,
+        chunksize: Optional[int],
+        deduplicate: Deduplicate,
+    ) -> List[Union[G2PResult, G2PError]]:
+        if not texts:
+            return []
+        if chunksize is None:
+            chunksize = max(1, min(256, math.ceil(len(texts) / (workers * 4))))
+        chunks = [texts[start : start + chunksize] for start in range(0, len(texts), chunksize)]
+        return [
+            result
+            for chunk in self._process_pool(workers).map(partial(_convert_in_worker, deduplicate=deduplicate), chunks)
+            for result in chunk
+        ]
+
+    def _process_pool(self, workers: int) -> ProcessPoolExecutor:
+        # One pool is kept so its workers load their resources once. Workers
+        # are spawned rather than forked, since loader, coalescing and
+        # AsyncG2P threads may hold locks at fork time.
+        with self._pool_lock:
+            if self._pool is not None and self._pool_workers != workers:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialize_worker,
+                    initargs=(
+                        {
+                            **self._config,
+                            "cache_size": 0,
+                            "cache_path": None,
+                            "on_stage": None,
+                            "background_load": False,
+                            "coalesce": False,
+                        },
+                    ),
+                )
+                self._pool_workers = workers
+                weakref.finalize(self, self._pool.shutdown, wait=False)
+            return self._pool
+
+    def convert_parallel(
+        self,
+        text: str,
+        *,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        executor: Executor = "process",
+    ) -> G2PResult:
+        """Convert one long text by splitting it into sentences and converting them in parallel.
+
+        Sentences end at ``SENTENCE_MARKS`` like in :meth:`iter_document`.
+        With ``executor="process"`` they are converted like :meth:`map`; with
+        ``"thread"`` they share this converter on a thread pool. The sentence
+        results are stitched into one ``G2PResult`` for the whole text, and
+        the first ``G2PError`` of any sentence is raised.
+        """
+
+        if not isinstance(text, str):
+            raise TypeError("text must be a string")
+        if executor not in {"process", "thread"}:
+            raise ConfigurationError("executor must be 'process' or 'thread'")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be positive")
+
+        pieces = list(split_sentences(text)) or [(0, text)]
+        # Whitespace between sentences is joined back as space tokens, since
+        # normalization would drop it at the edges of each sentence.
+        pieces[:-1] = [(offset, sentence.rstrip() or sentence) for offset, sentence in pieces[:-1]]
+        offsets, sentences = zip(*pieces)
+        if executor == "process":
+            results = self.map(sentences, workers=workers, chunksize=chunksize)
+        else:
+            chunksize = chunksize or max(1, math.ceil(len(sentences) / (workers * 4)))
+            chunks = [sentences[start : start + chunksize] for start in range(0, len(sentences), chunksize)]
+            with ThreadPoolExecutor(max_workers=min(workers, len(chunks)), thread_name_prefix="g2p-mix") as pool:
+                results = [result for chunk in pool.map(self.convert_batch, chunks) for result in chunk]
+        for result in results:
+            if isinstance(result, G2PError):
+                raise result
+        return self._pipeline.join_results(text, tuple(zip(offsets, results)))
+
+    def _convert_cached(
+        self,
+        texts: Sequence[str],
+        convert: Callable[[Sequence[str]], List[Union[G2PResult, G2PError]]],
+    ) -> List[Union[G2PResult, G2PError]]:
+        texts = tuple(texts)
+        if any(not isinstance(text, str) for text in texts):
+            raise TypeError("texts must contain only strings")
+        results: List[Union[G2PResult, G2PError, None]] = [None] * len(texts)
+        if self._cache is not None:
+            results = [self._cache.get(text) for text in texts]
+        missing = [index for index, result in enumerate(results) if result is None]
+        cacheable = not self._fallback_gated or self._load_finished()
+        if missing and self._store is not None:
+            stored = self._store.get_many([texts[index] for index in missing])
+            for index in missing:
+                result = stored.get(texts[index])
+                if result is not None:
+                    results[index] = result
+                    if self._cache is not None:
+                        self._cache.put(texts[index], result)
+            missing = [index for index in missing if results[index] is None]
+        if missing:
+            converted = []
+            for index, result in zip(missing, convert([texts[index] for index in missing])):
+                results[index] = result
+                if isinstance(result, G2PResult) and cacheable:
+                    converted.append((texts[index], result))
+                    if self._cache is not None:
+                        self._cache.put(texts[index], result)
+            if self._store is not None:
+                self._store.put_many(converted)
+        return results
 
     def compare(self, left: str, right: str) -> SimilarityResult:
         if not isinstance(left, str) or not isinstance(right, str):
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Mapping, Optional, Protocol, Tuple
+from dataclasses import dataclass, replace
+from typing import Callable, List, Mapping, Optional, Protocol, Sequence, Tuple
 
-from ..errors import BackendError, ConfigurationError
+from ..cache import CacheInfo, LruCache
+from ..errors import AlignmentError, BackendError, ConfigurationError
 from ..models import (
     ChineseDialect,
     Language,
@@ -14,6 +15,7 @@ from ..models import (
     PronunciationUnit,
     TextToken,
 )
+from ..resources import WarmupStep, component_warmup_steps
 
 
 @dataclass(frozen=True)
@@ -75,6 +77,18 @@ def encode_character_projection(
 
 
 class PronunciationBackend(Protocol):
+    """Predict pronunciations for the target tokens of one projection.
+
+    Backends may also define ``predict_batch(requests)``, returning one mapping
+    per request in order. It is optional; :func:`predict_batch` falls back to
+    calling ``predict`` once per request when a backend does not provide it.
+    Backends with lazily loaded models may define ``warmup_steps()``, returning
+    named loaders that the pipeline can run before the first request.
+    Backends passed as objects together with ``cache_path`` must define
+    ``fingerprint()``, returning a string that changes whenever their
+    settings change the pronunciations they predict.
+    """
+
     name: str
     capabilities: BackendCapabilities
 
@@ -85,6 +99,22 @@ class PronunciationBackend(Protocol):
         pass
 
 
+def predict_batch(
+    backend: PronunciationBackend,
+    requests: Sequence[PronunciationRequest],
+) -> List[Mapping[int, Pronunciation]]:
+    """Predict several requests through the backend's batch entry point when available."""
+
+    requests = tuple(requests)
+    batch = getattr(backend, "predict_batch", None)
+    if batch is None:
+        return [backend.predict(request) for request in requests]
+    results = list(batch(requests))
+    if len(results) != len(requests):
+        raise AlignmentError(f"{backend.name} returned {len(results)} batch results for {len(requests)} requests")
+    return results
+
+
 def unknown_unit(
     token: TextToken,
     index: int,
@@ -100,13 +130,56 @@ def unknown_unit(
     )
 
 
+class PronunciationMemo:
+    """Bounded cross-call memo of word pronunciations with one unit per character.
+
+    Entries are keyed by word text within one backend instance, so the backend
+    configuration is part of the key, and are freed with the backend. At most
+    ``maxsize`` words are kept; ``0`` disables the memo. A hit is rebound to the
+    asking token's id and source spans.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("memo_size must be non-negative")
+        self._entries: Optional[LruCache[Pronunciation]] = LruCache(maxsize) if maxsize else None
+
+    def get(self, token: TextToken) -> Optional[Pronunciation]:
+        if self._entries is None:
+            return None
+        pronunciation = self._entries.get(token.text)
+        if pronunciation is None:
+            return None
+        return replace(
+            pronunciation,
+            token_id=token.id,
+            units=tuple(
+                replace(unit, source_spans=(span,)) for unit, span in zip(pronunciation.units, token.source_spans)
+            ),
+        )
+
+    def put(self, token: TextToken, pronunciation: Pronunciation) -> None:
+        if self._entries is not None and len(pronunciation.units) == len(token.source_spans):
+            self._entries.put(token.text, pronunciation)
+
+    def info(self) -> CacheInfo:
+        if self._entries is None:
+            return CacheInfo(hits=0, misses=0, evictions=0, maxsize=0, size=0)
+        return self._entries.info()
+
+
 class FallbackBackend:
-    """Use a second compatible backend when the primary backend fails."""
+    """Use a second compatible backend when the primary backend fails.
+
+    While ``primary_ready`` returns ``False`` requests go straight to the
+    fallback, so a primary that is still loading elsewhere is never waited on.
+    """
 
     def __init__(
         self,
         primary: PronunciationBackend,
         fallback: PronunciationBackend,
+        primary_ready: Optional[Callable[[], bool]] = None,
     ) -> None:
         primary_identity = (
             primary.capabilities.language,
@@ -124,13 +197,19 @@ class FallbackBackend:
             raise ConfigurationError("Fallback backend must differ from the primary backend")
         self.primary = primary
         self.fallback = fallback
+        self._primary_ready = primary_ready
         self.name = f"{primary.name}->{fallback.name}"
         self.capabilities = primary.capabilities
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return component_warmup_steps(self.fallback) + component_warmup_steps(self.primary)
+
     def predict(
         self,
         request: PronunciationRequest,
     ) -> Mapping[int, Pronunciation]:
+        if self._primary_ready is not None and not self._primary_ready():
+            return self.fallback.predict(request)
         try:
             return self.primary.predict(request)
         except BackendError as primary_error:
@@ -142,3 +221,14 @@ class FallbackBackend:
                     f"{primary_error}; fallback backend "
                     f"{self.fallback.name!r} also failed: {fallback_error}"
                 ) from fallback_error
+
+    def predict_batch(
+        self,
+        requests: Sequence[PronunciationRequest],
+    ) -> List[Mapping[int, Pronunciation]]:
+        if self._primary_ready is not None and not self._primary_ready():
+            return predict_batch(self.fallback, requests)
+        try:
+            return predict_batch(self.primary, requests)
+        except BackendError:
+            return [self.predict(request) for request in requests]
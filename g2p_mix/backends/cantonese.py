@@ -14,8 +14,10 @@ from ..models import (
     UnknownPolicy,
 )
 from ..phonetics import split_jyutping
+from ..resources import InitializationLock, WarmupStep
 from .base import (
     BackendCapabilities,
+    PronunciationMemo,
     PronunciationRequest,
     encode_character_projection,
     unknown_unit,
@@ -94,16 +96,22 @@ class ToJyutpingBackend:
         if len(foreign_placeholder) != 1:
             raise ValueError("The model placeholder must be exactly one character")
         self._converter = converter
+        self._converter_lock = InitializationLock()
         self._placeholder = foreign_placeholder
         self._unknown_policy = UnknownPolicy(unknown_policy)
 
     def _get_converter(self) -> JyutpingConverter:
         if self._converter is None:
-            from ToJyutping import get_jyutping_list
+            with self._converter_lock:
+                if self._converter is None:
+                    from ToJyutping import get_jyutping_list
 
-            self._converter = get_jyutping_list
+                    self._converter = get_jyutping_list
         return self._converter
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("tojyutping", self._get_converter),)
+
     def _convert(self, text: str) -> JyutpingList:
         try:
             values = self._get_converter()(text)
@@ -115,6 +123,12 @@ class ToJyutpingBackend:
         except Exception as error:
             raise BackendError(f"ToJyutping prediction failed for {text!r}") from error
 
+    def predict_batch(
+        self,
+        requests: Sequence[PronunciationRequest],
+    ) -> List[Mapping[int, Pronunciation]]:
+        return [self.predict(request) for request in requests]
+
     def predict(
         self,
         request: PronunciationRequest,
@@ -183,8 +197,13 @@ class PyCantoneseBackend:
     def __init__(
         self,
         unknown_policy: UnknownPolicy = UnknownPolicy.STRICT,
+        memo_size: int = 0,
     ) -> None:
         self._unknown_policy = UnknownPolicy(unknown_policy)
+        self._memo = PronunciationMemo(memo_size)
+
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("pycantonese-jyutping", lambda: self._convert("粵")),)
 
     def _convert(self, text: str) -> List[Optional[str]]:
         try:
@@ -211,25 +230,43 @@ class PyCantoneseBackend:
         except Exception as error:
             raise BackendError(f"PyCantonese prediction failed for {text!r}") from error
 
+    def _pronounce(self, token, syllables_by_text: Dict[str, List[Optional[str]]]) -> Pronunciation:
+        if token.text not in syllables_by_text:
+            syllables_by_text[token.text] = self._convert(token.text)
+        syllables = syllables_by_text[token.text]
+        if len(syllables) != len(token.text):
+            raise AlignmentError(
+                f"{self.name} returned {len(syllables)} syllables for {token.text!r} ({len(token.text)} characters)"
+            )
+        return Pronunciation(
+            token_id=token.id,
+            units=_build_units(
+                token,
+                tuple((syllable,) if syllable is not None else None for syllable in syllables),
+                self.name,
+            ),
+            backend=self.name,
+        )
+
     def predict(
         self,
         request: PronunciationRequest,
     ) -> Mapping[int, Pronunciation]:
-        result = {}
-        for token in request.target_tokens:
-            syllables = self._convert(token.text)
-            if len(syllables) != len(token.text):
-                raise AlignmentError(
-                    f"{self.name} returned {len(syllables)} syllables for {token.text!r} ({len(token.text)} characters)"
-                )
+        return self.predict_batch((request,))[0]
 
-            result[token.id] = Pronunciation(
-                token_id=token.id,
-                units=_build_units(
-                    token,
-                    tuple((syllable,) if syllable is not None else None for syllable in syllables),
-                    self.name,
-                ),
-                backend=self.name,
-            )
-        return result
+    def predict_batch(
+        self,
+        requests: Sequence[PronunciationRequest],
+    ) -> List[Mapping[int, Pronunciation]]:
+        syllables_by_text: Dict[str, List[Optional[str]]] = {}
+        results = []
+        for request in requests:
+            result = {}
+            for token in request.target_tokens:
+                pronunciation = self._memo.get(token)
+                if pronunciation is None:
+                    pronunciation = self._pronounce(token, syllables_by_text)
+                    self._memo.put(token, pronunciation)
+                result[token.id] = pronunciation
+            results.append(result)
+        return results
@@ -3,12 +3,20 @@ from __future__ import annotations
 from dataclasses import dataclass
 from functools import lru_cache
 from importlib.resources import files
-from typing import Callable, List, Mapping, Optional, Protocol, Sequence, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Protocol, Sequence, Tuple
 
 from ..errors import BackendError
 from ..models import Language, PhoneAlphabet, ProjectionKind, Pronunciation, PronunciationUnit
 from ..phonetics import split_arpabet_phone
-from ..resources import ensure_bundled_nltk_data, load_cmudict, load_json
+from ..resources import (
+    InitializationLock,
+    WarmupStep,
+    component_warmup_steps,
+    ensure_bundled_nltk_data,
+    load_cmudict,
+    load_json,
+    single_flight,
+)
 from ..text.latin import fold_english_spelling
 from .base import BackendCapabilities, PronunciationRequest
 
@@ -58,6 +66,9 @@ class CmuLexicon:
             self._dictionary = load_cmudict()
         return self._dictionary
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("cmudict", lambda: self.dictionary),)
+
     def lookup(self, word: str) -> Tuple[Tuple[str, ...], ...]:
         return tuple(tuple(pronunciation) for pronunciation in self.dictionary.get(word.lower(), ()))
 
@@ -65,6 +76,20 @@ class CmuLexicon:
 class NltkContextAnalyzer:
     """Tag the English projection once so every target token shares context."""
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        # Only sentences with a covered homograph are tagged.
+        return (("nltk-tagger", self._load_tagger, True),)
+
+    @staticmethod
+    def _load_tagger() -> None:
+        ensure_bundled_nltk_data()
+        try:
+            import nltk
+
+            nltk.pos_tag(["warmup"])
+        except (ImportError, LookupError, OSError) as error:
+            raise BackendError("English POS resources are unavailable") from error
+
     def analyze(self, request: PronunciationRequest) -> Mapping[int, str]:
         tagged_text = []
         target_ids = []
@@ -117,6 +142,7 @@ class HomographRule:
     pos_prefix: str
 
 
+@single_flight
 @lru_cache(maxsize=1)
 def load_g2p_en_homographs() -> Mapping[str, HomographRule]:
     """Load g2p-en's data and apply project-reviewed corrections."""
@@ -184,6 +210,9 @@ class PosHomographResolver:
             self._rules = load_g2p_en_homographs()
         return self._rules
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("g2p-en-homographs", lambda: self.rules),)
+
     def needs_context(self, words: Sequence[str]) -> bool:
         return any(word.lower() in self.rules for word in words)
 
@@ -208,20 +237,30 @@ class G2pEnOovPredictor:
 
     def __init__(self, predictor: Optional[Callable[[str], Sequence[str]]] = None) -> None:
         self._predictor = predictor
+        self._predictor_lock = InitializationLock()
 
     def _ensure_predictor(self) -> Callable[[str], Sequence[str]]:
         if self._predictor is None:
-            try:
-                ensure_bundled_nltk_data()
-                import g2p_en
-
-                self._predictor = g2p_en.G2p().predict
-            except BackendError:
-                raise
-            except Exception as error:
-                raise BackendError("English OOV pronunciation resources are unavailable; install g2p-en") from error
+            with self._predictor_lock:
+                if self._predictor is None:
+                    self._predictor = self._load_predictor()
         return self._predictor
 
+    @staticmethod
+    def _load_predictor() -> Callable[[str], Sequence[str]]:
+        try:
+            ensure_bundled_nltk_data()
+            import g2p_en
+
+            return g2p_en.G2p().predict
+        except BackendError:
+            raise
+        except Exception as error:
+            raise BackendError("English OOV pronunciation resources are unavailable; install g2p-en") from error
+
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("g2p-en", self._ensure_predictor),)
+
     def predict(self, word: str) -> Sequence[str]:
         try:
             phones = self._ensure_predictor()(word)
@@ -261,18 +300,34 @@ class EnglishBackend:
         self._resolver = resolver or PosHomographResolver()
         self._oov_predictor = oov_predictor or G2pEnOovPredictor()
         self._segmenter = segmenter
+        self._segmenter_lock = InitializationLock()
 
     def _ensure_segmenter(self) -> Callable[[str], Sequence[str]]:
         if self._segmenter is None:
-            try:
-                import wordsegment
-
-                wordsegment.load()
-                self._segmenter = wordsegment.segment
-            except Exception as error:
-                raise BackendError("English OOV segmentation requires wordsegment") from error
+            with self._segmenter_lock:
+                if self._segmenter is None:
+                    self._segmenter = self._load_segmenter()
         return self._segmenter
 
+    @staticmethod
+    def _load_segmenter() -> Callable[[str], Sequence[str]]:
+        try:
+            import wordsegment
+
+            wordsegment.load()
+            return wordsegment.segment
+        except Exception as error:
+            raise BackendError("English OOV segmentation requires wordsegment") from error
+
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (
+            *component_warmup_steps(self._lexicon),
+            *component_warmup_steps(self._context_analyzer),
+            *component_warmup_steps(self._resolver),
+            ("wordsegment", self._ensure_segmenter),
+            *component_warmup_steps(self._oov_predictor),
+        )
+
     def _character(self, char: str) -> List[str]:
         char = char.lower()
         candidates = self._lexicon.lookup(char)
@@ -337,6 +392,20 @@ class EnglishBackend:
     def predict(
         self,
         request: PronunciationRequest,
+    ) -> Mapping[int, Pronunciation]:
+        return self._predict(request, {})
+
+    def predict_batch(
+        self,
+        requests: Sequence[PronunciationRequest],
+    ) -> List[Mapping[int, Pronunciation]]:
+        converted: Dict[Tuple[str, Optional[str]], Tuple[str, ...]] = {}
+        return [self._predict(request, converted) for request in requests]
+
+    def _predict(
+        self,
+        request: PronunciationRequest,
+        converted: Dict[Tuple[str, Optional[str]], Tuple[str, ...]],
     ) -> Mapping[int, Pronunciation]:
         target_tokens = request.target_tokens
         normalized_words = tuple(self._normalize(token.text) for token in target_tokens)
@@ -354,13 +423,16 @@ class EnglishBackend:
 
         result = {}
         for token, normalized_word in zip(target_tokens, normalized_words):
-            rendered_phones = tuple(
-                self._convert_normalized(
-                    normalized_word,
-                    original=token.text,
-                    pos=pos_by_id[token.id],
+            key = (normalized_word, pos_by_id[token.id])
+            if key not in converted:
+                converted[key] = tuple(
+                    self._convert_normalized(
+                        normalized_word,
+                        original=token.text,
+                        pos=pos_by_id[token.id],
+                    )
                 )
-            )
+            rendered_phones = converted[key]
             if not rendered_phones:
                 raise BackendError(f"English backend returned no phones for {token.text!r}")
             phones = []
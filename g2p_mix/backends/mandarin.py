@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence as SequenceABC
-from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from ..errors import AlignmentError, BackendError, G2PError
 from ..models import (
@@ -13,15 +13,17 @@ from ..models import (
     UnknownPolicy,
 )
 from ..phonetics import split_pinyin
-from ..resources import install_pypinyin_overrides
+from ..resources import InitializationLock, WarmupStep, install_pypinyin_overrides
 from .base import (
     BackendCapabilities,
+    CharacterProjection,
+    PronunciationMemo,
     PronunciationRequest,
     encode_character_projection,
     unknown_unit,
 )
 
-G2PWPredictor = Callable[[str], Sequence[Sequence[Optional[str]]]]
+G2PWPredictor = Callable[[Union[str, List[str]]], Sequence[Sequence[Optional[str]]]]
 
 
 def _flatten_syllables(values: Iterable) -> List[str]:
@@ -91,19 +93,30 @@ class PypinyinBackend:
         strict: bool = False,
         converter=None,
         unknown_policy: UnknownPolicy = UnknownPolicy.STRICT,
+        memo_size: int = 0,
     ) -> None:
         self._strict = strict
         self._converter = converter
+        self._converter_lock = InitializationLock()
         self._unknown_policy = UnknownPolicy(unknown_policy)
+        self._memo = PronunciationMemo(memo_size)
 
     def _get_converter(self):
         if self._converter is None:
-            from pypinyin.converter import UltimateConverter
+            with self._converter_lock:
+                if self._converter is None:
+                    from pypinyin.converter import UltimateConverter
 
-            install_pypinyin_overrides()
-            self._converter = UltimateConverter(neutral_tone_with_five=True)
+                    install_pypinyin_overrides()
+                    self._converter = UltimateConverter(neutral_tone_with_five=True)
         return self._converter
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (
+            ("pypinyin-overrides", install_pypinyin_overrides),
+            ("pypinyin", self._get_converter),
+        )
+
     def _convert(self, text: str) -> List[str]:
         try:
             from pypinyin import Style
@@ -125,16 +138,32 @@ class PypinyinBackend:
         self,
         request: PronunciationRequest,
     ) -> Mapping[int, Pronunciation]:
-        return {
-            token.id: _build_pronunciation(
-                token,
-                self._convert(token.text),
-                backend=self.name,
-                strict=self._strict,
-                unknown_policy=self._unknown_policy,
-            )
-            for token in request.target_tokens
-        }
+        return self.predict_batch((request,))[0]
+
+    def predict_batch(
+        self,
+        requests: Sequence[PronunciationRequest],
+    ) -> List[Mapping[int, Pronunciation]]:
+        syllables: Dict[str, List[str]] = {}
+        results = []
+        for request in requests:
+            result = {}
+            for token in request.target_tokens:
+                pronunciation = self._memo.get(token)
+                if pronunciation is None:
+                    if token.text not in syllables:
+                        syllables[token.text] = self._convert(token.text)
+                    pronunciation = _build_pronunciation(
+                        token,
+                        syllables[token.text],
+                        backend=self.name,
+                        strict=self._strict,
+                        unknown_policy=self._unknown_policy,
+                    )
+                    self._memo.put(token, pronunciation)
+                result[token.id] = pronunciation
+            results.append(result)
+        return results
 
 
 class G2PWBackend:
@@ -159,6 +188,7 @@ class G2PWBackend:
             raise ValueError("num_workers must be non-negative")
         self._strict = strict
         self._converter = converter
+        self._converter_lock = InitializationLock()
         self._placeholder = foreign_placeholder
         self._num_workers = num_workers
         self._unknown_policy = UnknownPolicy(unknown_policy)
@@ -169,60 +199,71 @@ class G2PWBackend:
 
     def _get_converter(self) -> G2PWPredictor:
         if self._converter is None:
-            try:
-                from g2pw import G2PWConverter
-                from modelscope import snapshot_download
-            except ImportError as error:
-                raise BackendError(
-                    "G2PW backend is unavailable; install it with 'pip install g2p-mix[g2pw]'"
-                ) from error
-
-            try:
-                repo_dir = snapshot_download("pengzhendong/g2pw")
-            except G2PError:
-                raise
-            except Exception as error:
-                raise BackendError("G2PW model snapshot download failed") from error
-            try:
-                converter = G2PWConverter(
-                    model_dir=f"{repo_dir}/G2PWModel",
-                    style="pinyin",
-                    model_source=f"{repo_dir}/bert-base-chinese",
-                    num_workers=self._num_workers,
-                    enable_non_tradional_chinese=True,
-                )
-                converter.num_workers = self._num_workers
-            except G2PError:
-                raise
-            except Exception as error:
-                raise BackendError("G2PW converter initialization failed") from error
-            self._converter = converter
+            with self._converter_lock:
+                if self._converter is None:
+                    self._converter = self._load_converter()
         return self._converter
 
-    def _convert(self, text: str) -> Sequence[Optional[str]]:
+    def _load_converter(self) -> G2PWPredictor:
+        try:
+            from g2pw import G2PWConverter
+            from modelscope import snapshot_download
+        except ImportError as error:
+            raise BackendError("G2PW backend is unavailable; install it with 'pip install g2p-mix[g2pw]'") from error
+
+        try:
+            repo_dir = snapshot_download("pengzhendong/g2pw")
+        except G2PError:
+            raise
+        except Exception as error:
+            raise BackendError("G2PW model snapshot download failed") from error
+        try:
+            converter = G2PWConverter(
+                model_dir=f"{repo_dir}/G2PWModel",
+                style="pinyin",
+                model_source=f"{repo_dir}/bert-base-chinese",
+                num_workers=self._num_workers,
+                enable_non_tradional_chinese=True,
+            )
+            converter.num_workers = self._num_workers
+        except G2PError:
+            raise
+        except Exception as error:
+            raise BackendError("G2PW converter initialization failed") from error
+        return converter
+
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return self._fallback.warmup_steps() + (("g2pw", self._get_converter),)
+
+    def _call_converter(self, sentences):
         try:
-            values = self._get_converter()(text)
+            values = self._get_converter()(sentences)
         except G2PError:
             raise
         except Exception as error:
             raise BackendError("G2PW prediction failed") from error
+        if not isinstance(values, SequenceABC) or isinstance(values, (str, bytes)):
+            raise BackendError(
+                f"{self.name} converter outer result for projection {sentences!r} must be a non-string sequence"
+            )
+        return values
+
+    def _sentence_syllables(self, text: str, syllables) -> Sequence[Optional[str]]:
+        if not isinstance(syllables, SequenceABC) or isinstance(syllables, (str, bytes)):
+            raise BackendError(
+                f"{self.name} converter sentence result for projection {text!r} must be a non-string sequence"
+            )
+        return tuple(syllables)
 
+    def _convert(self, text: str) -> Sequence[Optional[str]]:
+        values = self._call_converter(text)
         try:
-            if not isinstance(values, SequenceABC) or isinstance(values, (str, bytes)):
-                raise BackendError(
-                    f"{self.name} converter outer result for projection {text!r} must be a non-string sequence"
-                )
             sentence_count = len(values)
             if sentence_count != 1:
                 raise BackendError(
                     f"{self.name} converter returned {sentence_count} sentences for one projection {text!r}"
                 )
-            syllables = values[0]
-            if not isinstance(syllables, SequenceABC) or isinstance(syllables, (str, bytes)):
-                raise BackendError(
-                    f"{self.name} converter sentence result for projection {text!r} must be a non-string sequence"
-                )
-            return tuple(syllables)
+            return self._sentence_syllables(text, values[0])
         except G2PError:
             raise
         except Exception as error:
@@ -230,12 +271,47 @@ class G2PWBackend:
                 f"{self.name} prediction failed while validating converter output for projection {text!r}"
             ) from error
 
+    def _convert_many(self, texts: Sequence[str]) -> List[Sequence[Optional[str]]]:
+        values = self._call_converter(list(texts))
+        try:
+            if len(values) != len(texts):
+                raise BackendError(
+                    f"{self.name} converter returned {len(values)} sentences for {len(texts)} projections"
+                )
+            return [self._sentence_syllables(text, syllables) for text, syllables in zip(texts, values)]
+        except G2PError:
+            raise
+        except Exception as error:
+            raise BackendError(f"{self.name} prediction failed while validating batched converter output") from error
+
     def predict(
         self,
         request: PronunciationRequest,
     ) -> Mapping[int, Pronunciation]:
         projection = encode_character_projection(request, self._placeholder)
-        syllables = self._convert(projection.text)
+        return self._decode(request, projection, self._convert(projection.text))
+
+    def predict_batch(
+        self,
+        requests: Sequence[PronunciationRequest],
+    ) -> List[Mapping[int, Pronunciation]]:
+        """Run the model once over every projection in the batch."""
+
+        if not requests:
+            return []
+        projections = [encode_character_projection(request, self._placeholder) for request in requests]
+        syllables = self._convert_many([projection.text for projection in projections])
+        return [
+            self._decode(request, projection, values)
+            for request, projection, values in zip(requests, projections, syllables)
+        ]
+
+    def _decode(
+        self,
+        request: PronunciationRequest,
+        projection: CharacterProjection,
+        syllables: Sequence[Optional[str]],
+    ) -> Mapping[int, Pronunciation]:
         if len(syllables) != len(projection.sources):
             raise BackendError(
                 f"{self.name} converter returned {len(syllables)} positions for a "
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Generic, Hashable, Iterable, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
+
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    size: int
+
+
+class LruCache(Generic[V]):
+    """Thread-safe least-recently-used mapping with ``cache_info`` statistics."""
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __reduce__(self):
+        return (LruCache, (self._maxsize,))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """Return the value for ``key`` without counting or reordering it."""
+
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._entries))
+
+
+class SingleFlight(Generic[V]):
+    """Let concurrent calls with the same key share one in-flight computation.
+
+    The first caller computes; callers arriving before it finishes wait for
+    its result or exception instead of computing again. Nothing is kept once
+    the computation finishes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+        self._shared = 0
+
+    def __reduce__(self):
+        return (SingleFlight, ())
+
+    @property
+    def shared(self) -> int:
+        """Number of calls that received another caller's result."""
+
+        return self._shared
+
+    def run(self, key: Hashable, compute: Callable[[], V]) -> V:
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = self._calls[key] = Future()
+            else:
+                self._shared += 1
+        if not owner:
+            return future.result()
+        try:
+            result = compute()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class SqliteResultCache(Generic[V]):
+    """Persistent results keyed by ``(fingerprint, text)`` in one sqlite file.
+
+    Entries written under other fingerprints stay in the file, so returning to
+    an earlier configuration reuses its results. Results are stored pickled,
+    so the file is trusted input: only open files this package wrote.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], fingerprint: str) -> None:
+        self._path = os.fspath(path)
+        self._fingerprint = fingerprint
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "fingerprint TEXT NOT NULL, text TEXT NOT NULL, result BLOB NOT NULL, "
+                "PRIMARY KEY (fingerprint, text)) WITHOUT ROWID"
+            )
+
+    def __reduce__(self):
+        return (SqliteResultCache, (self._path, self._fingerprint))
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    def get_many(self, texts: Sequence[str]) -> Dict[str, V]:
+        found: Dict[str, V] = {}
+        unique = list(dict.fromkeys(texts))
+        with self._lock:
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                rows = self._connection.execute(
+                    f"SELECT text, result FROM results WHERE fingerprint = ? AND text IN ({','.join('?' * len(chunk))})",
+                    (self._fingerprint, *chunk),
+                ).fetchall()
+                for text, payload in rows:
+                    try:
+                        found[text] = pickle.loads(payload)
+                    except Exception:
+                        # Entries written by an incompatible version are recomputed.
+                        continue
+        return found
+
+    def put_many(self, items: Iterable[Tuple[str, V]]) -> None:
+        rows = [
+            (self._fingerprint, text, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)) for text, value in items
+        ]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
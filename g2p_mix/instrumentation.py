@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, Tuple
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Wall time of one pipeline stage run by one component.
+
+    ``stage`` is one of ``normalize``, ``tokenize``, ``segment``, ``project``,
+    ``predict``, ``validate``, ``process``, ``transcribe`` or ``render``.
+    ``items`` counts the texts handled by a batched call.
+    """
+
+    stage: str
+    component: str
+    seconds: float
+    items: int = 1
+
+
+StageHook = Callable[[StageTiming], None]
+
+
+@dataclass(frozen=True)
+class StageSummary:
+    calls: int
+    items: int
+    total_seconds: float
+    max_seconds: float
+
+
+class StageTimingCollector:
+    """Thread-safe ``on_stage`` hook that keeps running totals per stage and component."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._totals: Dict[Tuple[str, str], StageSummary] = {}
+
+    def __call__(self, timing: StageTiming) -> None:
+        key = (timing.stage, timing.component)
+        with self._lock:
+            previous = self._totals.get(key)
+            if previous is None:
+                self._totals[key] = StageSummary(1, timing.items, timing.seconds, timing.seconds)
+            else:
+                self._totals[key] = StageSummary(
+                    previous.calls + 1,
+                    previous.items + timing.items,
+                    previous.total_seconds + timing.seconds,
+                    max(previous.max_seconds, timing.seconds),
+                )
+
+    def summary(self) -> Dict[Tuple[str, str], StageSummary]:
+        with self._lock:
+            return dict(self._totals)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._totals.clear()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from array import array
+from dataclasses import MISSING, dataclass, replace
 from enum import Enum
-from typing import Mapping, Optional, Tuple
+from functools import cached_property
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, Union
 
 
 class Language(str, Enum):
@@ -66,13 +68,113 @@ class Span:
         return text[self.start : self.end]
 
 
+class SourceMap(Sequence[Span]):
+    """Source spans of normalized characters, stored as two offset arrays.
+
+    Items are ``Span`` values created on access, so a map costs two integers
+    per character however many normalizers pass it along. Like a tuple it can
+    be sliced and concatenated with tuples or lists of spans, and it compares
+    and hashes equal to the tuple of the same spans.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, spans: Iterable[Span] = ()) -> None:
+        self._starts = array("I")
+        self._ends = array("I")
+        for span in spans:
+            self._starts.append(span.start)
+            self._ends.append(span.end)
+
+    @classmethod
+    def identity(cls, length: int) -> "SourceMap":
+        return cls._from_arrays(array("I", range(length)), array("I", range(1, length + 1)))
+
+    @classmethod
+    def _from_arrays(cls, starts: array, ends: array) -> "SourceMap":
+        value = cls.__new__(cls)
+        value._starts = starts
+        value._ends = ends
+        return value
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Span, "SourceMap"]:
+        if isinstance(index, slice):
+            return self._from_arrays(self._starts[index], self._ends[index])
+        return Span(self._starts[index], self._ends[index])
+
+    def __iter__(self) -> Iterator[Span]:
+        return map(Span, self._starts, self._ends)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SourceMap):
+            return self._starts == other._starts and self._ends == other._ends
+        if isinstance(other, (tuple, list)):
+            return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Equal to the hash of the equivalent tuple, which compares equal.
+        return hash(tuple(self))
+
+    def __add__(self, other: object) -> "SourceMap":
+        if isinstance(other, SourceMap):
+            return self._from_arrays(self._starts + other._starts, self._ends + other._ends)
+        if isinstance(other, (tuple, list)):
+            return self + SourceMap(other)
+        return NotImplemented
+
+    def __radd__(self, other: object) -> "SourceMap":
+        if isinstance(other, (tuple, list)):
+            return SourceMap(other) + self
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SourceMap({list(self)!r})"
+
+    def cover(self, start: int, end: int) -> Optional[Span]:
+        """Return the smallest span covering items ``start:end``, or ``None`` when empty."""
+
+        if start >= end:
+            return None
+        return Span(min(self._starts[start:end]), max(self._ends[start:end]))
+
+
+class SourceMapBuilder:
+    """Collect a ``SourceMap`` without creating a ``Span`` per character."""
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self) -> None:
+        self._starts = array("I")
+        self._ends = array("I")
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def extend(self, sources: SourceMap) -> None:
+        self._starts.extend(sources._starts)
+        self._ends.extend(sources._ends)
+
+    def repeat(self, span: Span, count: int) -> None:
+        self._starts.extend(array("I", (span.start,)) * count)
+        self._ends.extend(array("I", (span.end,)) * count)
+
+    def build(self, start: int = 0, end: Optional[int] = None) -> SourceMap:
+        return SourceMap._from_arrays(self._starts[start:end], self._ends[start:end])
+
+
 @dataclass(frozen=True)
 class NormalizedText:
     original: str
     text: str
-    char_sources: Tuple[Span, ...]
+    char_sources: SourceMap
 
     def __post_init__(self) -> None:
+        if not isinstance(self.char_sources, SourceMap):
+            object.__setattr__(self, "char_sources", SourceMap(self.char_sources))
         if len(self.text) != len(self.char_sources):
             raise ValueError("Every normalized character must have a source span")
 
@@ -81,11 +183,11 @@ class NormalizedText:
         return cls(
             original=text,
             text=text,
-            char_sources=tuple(Span(index, index + 1) for index in range(len(text))),
+            char_sources=SourceMap.identity(len(text)),
         )
 
     def sources_for(self, span: Span) -> Tuple[Span, ...]:
-        return self.char_sources[span.start : span.end]
+        return tuple(self.char_sources[span.start : span.end])
 
 
 @dataclass(frozen=True)
@@ -169,23 +271,68 @@ class OutputToken:
         return self.pronunciation.units
 
 
+class Deferred:
+    """Wrap a zero-argument function whose value fills a lazy result field on first access."""
+
+    __slots__ = ("compute",)
+
+    def __init__(self, compute: Callable[[], Any]) -> None:
+        self.compute = compute
+
+
+class _LazyField:
+    """Frozen-dataclass field that resolves a ``Deferred`` value once and keeps it."""
+
+    def __init__(self, default: Any = MISSING) -> None:
+        self._default = default
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            if self._default is MISSING:
+                raise AttributeError(self._name)
+            return self._default
+        value = instance.__dict__[self._name]
+        if isinstance(value, Deferred):
+            value = value.compute()
+            instance.__dict__[self._name] = value
+        return value
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self._name] = value
+
+
 @dataclass(frozen=True)
 class G2PResult:
+    """Converted text; ``projections``, ``warnings`` and ``phones`` may be computed on first access."""
+
     original_text: str
     normalized_text: str
     tokens: Tuple[OutputToken, ...]
-    projections: Mapping[Language, LanguageProjection]
-    warnings: Tuple[str, ...] = ()
-    phones: Tuple[str, ...] = ()
+    projections: Mapping[Language, LanguageProjection] = _LazyField()
+    warnings: Tuple[str, ...] = _LazyField(())
+    phones: Tuple[str, ...] = _LazyField(())
     output: str = "native"
 
+    def __getstate__(self):
+        return {
+            name: getattr(self, name) if name in _LAZY_RESULT_FIELDS else value
+            for name, value in self.__dict__.items()
+            if name not in {"units", "base_phones"}
+        }
+
     def reconstruct_original(self) -> str:
         return self.original_text
 
-    @property
+    @cached_property
     def units(self) -> Tuple[PronunciationUnit, ...]:
         return tuple(unit for token in self.tokens for unit in token.units)
 
-    @property
+    @cached_property
     def base_phones(self) -> Tuple[str, ...]:
         return tuple(phone for unit in self.units for phone in unit.phones)
+
+
+_LAZY_RESULT_FIELDS = frozenset({"projections", "warnings", "phones"})
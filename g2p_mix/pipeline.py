@@ -1,27 +1,89 @@
 from __future__ import annotations
 
 from dataclasses import replace
-from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+from functools import partial
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, TypeVar, Union
 
-from .backends.base import PronunciationRequest
-from .errors import ConfigurationError
+from .backends.base import PronunciationRequest, predict_batch
+from .cache import CacheInfo, LruCache
+from .errors import ConfigurationError, G2PError
+from .instrumentation import StageHook, StageTiming
 from .models import (
+    Boundary,
+    Deferred,
     G2PResult,
     Language,
     LanguageProjection,
+    NormalizedText,
     OutputToken,
     PhoneAlphabet,
     Pronunciation,
+    Span,
     TextToken,
+    TokenKind,
 )
 from .profiles import (
     ChineseProfile,
     EnglishProfile,
 )
 from .renderers import IpaRenderer, NativeRenderer
+from .resources import WarmupReport, WarmupStep, component_warmup_steps, run_warmup
 from .text import LosslessTokenizer, NormalizationPipeline, ProjectionBuilder, TextAnalyzer
 from .transcription import IpaTranscriber, ResultTranscriber
-from .validation import validate_prediction, validate_processor_identity
+from .validation import (
+    ValidationMode,
+    ValidationPolicy,
+    ValidationStats,
+    validate_prediction,
+    validate_processor_identity,
+)
+
+T = TypeVar("T")
+BatchResult = Union[G2PResult, G2PError]
+
+
+def _reproject(
+    tokens: Sequence[TextToken],
+    pronunciations: Mapping[int, Pronunciation],
+    source: NormalizedText,
+    target: NormalizedText,
+) -> Optional[Tuple[Tuple[TextToken, ...], Dict[int, Pronunciation]]]:
+    """Move tokens and pronunciations of ``source`` onto ``target``, which normalizes to the same text.
+
+    Unit spans are matched in order against the normalized characters of
+    their token. ``None`` is returned when a unit span cannot be matched.
+    """
+
+    moved_tokens = []
+    moved_pronunciations = {}
+    for token in tokens:
+        moved_tokens.append(replace(token, source_spans=target.sources_for(token.normalized_span)))
+        pronunciation = pronunciations.get(token.id)
+        if pronunciation is None:
+            continue
+        position = token.normalized_span.start
+        units = []
+        for unit in pronunciation.units:
+            spans = []
+            for span in unit.source_spans:
+                while position < token.normalized_span.end and source.char_sources[position] != span:
+                    position += 1
+                if position == token.normalized_span.end:
+                    return None
+                spans.append(target.char_sources[position])
+                position += 1
+            units.append(replace(unit, source_spans=tuple(spans)))
+        moved_pronunciations[token.id] = replace(pronunciation, units=tuple(units))
+    if len(moved_pronunciations) != len(pronunciations):
+        return None
+    return tuple(moved_tokens), moved_pronunciations
+
+
+class _Analysis(NamedTuple):
+    normalized: NormalizedText
+    tokens: Tuple[TextToken, ...]
+    pronunciations: Dict[int, Pronunciation]
 
 
 class G2PPipeline:
@@ -34,6 +96,11 @@ class G2PPipeline:
         projector: Optional[ProjectionBuilder] = None,
         output_alphabet: Optional[PhoneAlphabet] = None,
         transcriber: Optional[ResultTranscriber] = None,
+        validation: ValidationMode = ValidationMode.FULL,
+        validation_interval: int = 100,
+        on_stage: Optional[StageHook] = None,
+        normalized_cache_size: int = 0,
+        cache_ready: Optional[Callable[[], bool]] = None,
     ) -> None:
         if transcriber is not None and output_alphabet is None:
             output_alphabet = transcriber.target_alphabet
@@ -54,111 +121,689 @@ class G2PPipeline:
         self.output_alphabet = output_alphabet
         self._transcriber = transcriber or (IpaTranscriber() if output_alphabet is PhoneAlphabet.IPA else None)
         self._renderer = IpaRenderer() if output_alphabet is PhoneAlphabet.IPA else NativeRenderer()
+        try:
+            self._validation = ValidationPolicy(validation, validation_interval)
+        except ValueError as error:
+            raise ConfigurationError(
+                "validation must be 'full', 'sampled' or 'off' with a positive validation_interval"
+            ) from error
+        self._on_stage = on_stage
+        # Analyses keyed by normalized text; ``cache_ready`` holds back stores,
+        # e.g. while a fallback backend stands in for the primary.
+        self._analyses: Optional[LruCache[_Analysis]] = (
+            LruCache(normalized_cache_size) if normalized_cache_size else None
+        )
+        self._cache_ready = cache_ready
 
     def __call__(self, text: str) -> G2PResult:
         return self.convert(text)
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        """Return the named lazy loaders of every component, without duplicates."""
+
+        components = (
+            *self._normalizer.normalizers,
+            self.chinese.segmenter,
+            self.chinese.backend,
+            *self.chinese.processors,
+            self.english.backend,
+            *self.english.processors,
+        )
+        steps: Dict[str, WarmupStep] = {}
+        for component in components:
+            for step in component_warmup_steps(component):
+                steps.setdefault(step[0], step)
+        return tuple(steps.values())
+
+    def warmup(self) -> WarmupReport:
+        """Load every lazily initialized resource before the first conversion."""
+
+        return run_warmup(self.warmup_steps())
+
+    def validation_stats(self) -> ValidationStats:
+        """Return how many conversions ran the contract checks and how many violated them."""
+
+        return self._validation.stats()
+
+    def normalized_cache_info(self) -> CacheInfo:
+        """Return hit, miss and eviction counts of the ``normalized_cache_size`` analysis cache."""
+
+        if self._analyses is None:
+            return CacheInfo(hits=0, misses=0, evictions=0, maxsize=0, size=0)
+        return self._analyses.info()
+
+    def normalized_cache_clear(self) -> None:
+        if self._analyses is not None:
+            self._analyses.clear()
+
     def convert(self, text: str) -> G2PResult:
+        return self._build_result(text, *self._pronounce(text))
+
+    def phones(self, text: str) -> Tuple[str, ...]:
+        """Return only ``convert(text).phones``, without building the structured result."""
+
+        return self._render_phones(text, *self._pronounce(text))
+
+    def convert_batch(self, texts: Sequence[str], *, deduplicate_normalized: bool = False) -> List[BatchResult]:
+        """Convert many texts stage by stage, isolating package errors per item.
+
+        The returned list follows the input order. A text that fails with a
+        ``G2PError`` occupies its slot with that error instead of aborting the
+        batch; any other exception still propagates. With
+        ``deduplicate_normalized``, texts that normalize to the same text are
+        analyzed and predicted once and the source spans are re-projected onto
+        each of them.
+        """
+
+        return self._convert_batch(texts, self._build_result, deduplicate_normalized)
+
+    def phones_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        deduplicate_normalized: bool = False,
+    ) -> List[Union[Tuple[str, ...], G2PError]]:
+        """Return the phones of each text like ``convert_batch``, without structured results."""
+
+        return self._convert_batch(texts, self._render_phones, deduplicate_normalized)
+
+    def _pronounce(
+        self,
+        text: str,
+    ) -> Tuple[NormalizedText, Tuple[TextToken, ...], Dict[Language, LanguageProjection], Dict[int, Pronunciation]]:
         if not isinstance(text, str):
             raise TypeError("text must be a string")
 
-        normalized = self._normalizer.normalize(text)
-        tokens = self._analyzer.analyze(normalized)
-        projections = {
-            language: self._projector.build(tokens, target=language)
-            for language in (Language.CHINESE, Language.ENGLISH)
-        }
+        # Read before any work, so a primary that becomes ready mid-request
+        # does not let this request's fallback analysis into the cache.
+        cacheable = self._analysis_cacheable()
+        return self._pronounce_normalized(text, self._normalize(text), self._validation.sample(), cacheable)
 
+    def _pronounce_normalized(
+        self,
+        text: str,
+        normalized: NormalizedText,
+        validate: bool,
+        cacheable: bool,
+    ) -> Tuple[NormalizedText, Tuple[TextToken, ...], Dict[Language, LanguageProjection], Dict[int, Pronunciation]]:
+        cached = self._cached_analysis(normalized)
+        if cached is not None:
+            return (normalized, *cached)
+        tokens = self._analyze(normalized)
+        projections = self._timed_project(tokens)
         pronunciations: Dict[int, Pronunciation] = {}
-        pronunciations.update(
-            self._predict(
-                profile=self.chinese,
-                tokens=tokens,
-                projection=projections[Language.CHINESE],
-                source_text=text,
+        for profile in (self.chinese, self.english):
+            pronunciations.update(
+                self._predict(
+                    profile=profile,
+                    tokens=tokens,
+                    projection=projections[profile.backend.capabilities.language],
+                    source_text=text,
+                    validate=validate,
+                )
             )
+        pronunciations = self._process(tokens, pronunciations, source_text=text, validate=validate)
+        if cacheable:
+            self._store_analysis(normalized, tokens, pronunciations)
+        return normalized, tokens, projections, pronunciations
+
+    def _cached_analysis(
+        self,
+        normalized: NormalizedText,
+    ) -> Optional[Tuple[Tuple[TextToken, ...], Dict[Language, LanguageProjection], Dict[int, Pronunciation]]]:
+        if self._analyses is None:
+            return None
+        entry = self._analyses.get(normalized.text)
+        if entry is None:
+            return None
+        reprojected = _reproject(entry.tokens, entry.pronunciations, entry.normalized, normalized)
+        if reprojected is None:
+            return None
+        tokens, pronunciations = reprojected
+        # Projections are rebuilt from this caller's tokens, not shared with
+        # the text whose analysis is reused.
+        return tokens, self._timed_project(tokens), pronunciations
+
+    def _timed_project(self, tokens: Tuple[TextToken, ...]) -> Dict[Language, LanguageProjection]:
+        return self._timed("project", type(self._projector).__name__, self._project, tokens)
+
+    def _analysis_cacheable(self) -> bool:
+        return self._analyses is not None and (self._cache_ready is None or self._cache_ready())
+
+    def _store_analysis(
+        self,
+        normalized: NormalizedText,
+        tokens: Tuple[TextToken, ...],
+        pronunciations: Dict[int, Pronunciation],
+    ) -> None:
+        if self._analyses is not None:
+            self._analyses.put(normalized.text, _Analysis(normalized, tokens, pronunciations))
+
+    def _convert_batch(
+        self,
+        texts: Sequence[str],
+        finish: Callable[
+            [str, NormalizedText, Tuple[TextToken, ...], Dict[Language, LanguageProjection], Dict[int, Pronunciation]],
+            T,
+        ],
+        deduplicate_normalized: bool = False,
+    ) -> List[Union[T, G2PError]]:
+        texts = tuple(texts)
+        if any(not isinstance(text, str) for text in texts):
+            raise TypeError("texts must contain only strings")
+
+        results: List[Optional[Union[T, G2PError]]] = [None] * len(texts)
+        cacheable = self._analysis_cacheable()
+        validate = [self._validation.sample() for _ in texts]
+        normalized = self._run_stage(results, range(len(texts)), lambda index: self._normalize(texts[index]))
+        cached = {}
+        for index, value in normalized.items():
+            analysis = self._cached_analysis(value)
+            if analysis is not None:
+                cached[index] = analysis
+        duplicates: Dict[int, int] = {}
+        if deduplicate_normalized:
+            first: Dict[str, int] = {}
+            for index, value in normalized.items():
+                if index in cached:
+                    continue
+                representative = first.setdefault(value.text, index)
+                if representative != index:
+                    duplicates[index] = representative
+        tokens = self._run_stage(
+            results,
+            [index for index in normalized if index not in duplicates and index not in cached],
+            lambda index: self._analyze(normalized[index]),
+        )
+        projections = self._run_stage(
+            results,
+            tokens,
+            lambda index: self._timed_project(tokens[index]),
         )
-        pronunciations.update(
-            self._predict(
-                profile=self.english,
-                tokens=tokens,
-                projection=projections[Language.ENGLISH],
-                source_text=text,
+
+        pronunciations: Dict[int, Dict[int, Pronunciation]] = {index: {} for index in projections}
+        for profile in (self.chinese, self.english):
+            language = profile.backend.capabilities.language
+            predicted = self._predict_batch(
+                results,
+                profile,
+                {index: (tokens[index], projections[index][language], texts[index]) for index in pronunciations},
+                validate,
             )
+            pronunciations = {index: {**pronunciations[index], **predicted[index]} for index in predicted}
+
+        processed = self._run_stage(
+            results,
+            pronunciations,
+            lambda index: self._process(
+                tokens[index],
+                pronunciations[index],
+                source_text=texts[index],
+                validate=validate[index],
+            ),
+        )
+        if cacheable:
+            for index in processed:
+                self._store_analysis(normalized[index], tokens[index], processed[index])
+        for index, (cached_tokens, cached_projections, cached_pronunciations) in cached.items():
+            tokens[index] = cached_tokens
+            projections[index] = cached_projections
+            processed[index] = cached_pronunciations
+        for index, representative in duplicates.items():
+            reprojected = None
+            if representative in processed:
+                reprojected = _reproject(
+                    tokens[representative],
+                    processed[representative],
+                    normalized[representative],
+                    normalized[index],
+                )
+            if reprojected is None:
+                # The representative failed or a processor produced spans that
+                # cannot be mapped, so this text is converted on its own.
+                pronounced = self._run_stage(
+                    results,
+                    (index,),
+                    lambda index: self._pronounce_normalized(
+                        texts[index], normalized[index], validate[index], cacheable
+                    ),
+                )
+                if index not in pronounced:
+                    continue
+                _, tokens[index], projections[index], processed[index] = pronounced[index]
+            else:
+                tokens[index], processed[index] = reprojected
+                projections[index] = self._timed_project(tokens[index])
+
+        finished = self._run_stage(
+            results,
+            processed,
+            lambda index: finish(
+                texts[index],
+                normalized[index],
+                tokens[index],
+                projections[index],
+                processed[index],
+            ),
+        )
+        for index, result in finished.items():
+            results[index] = result
+        return results
+
+    @staticmethod
+    def _run_stage(
+        results: List[Optional[Union[object, G2PError]]],
+        indices: Iterable[int],
+        stage: Callable[[int], T],
+    ) -> Dict[int, T]:
+        completed = {}
+        for index in indices:
+            try:
+                completed[index] = stage(index)
+            except G2PError as error:
+                results[index] = error
+        return completed
+
+    def _timed(self, stage: str, component: str, call: Callable[..., T], *args, items: int = 1, **kwargs) -> T:
+        if self._on_stage is None:
+            return call(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            self._on_stage(StageTiming(stage, component, perf_counter() - start, items))
+
+    def _normalize(self, text: str) -> NormalizedText:
+        if self._on_stage is None:
+            return self._normalizer.normalize(text)
+        value = NormalizedText.identity(text)
+        for normalizer in self._normalizer.normalizers:
+            value = self._timed("normalize", type(normalizer).__name__, normalizer.normalize, value)
+        return value
+
+    def _analyze(self, normalized: NormalizedText) -> Tuple[TextToken, ...]:
+        if self._on_stage is None:
+            return self._analyzer.analyze(normalized)
+        coarse = self._timed(
+            "tokenize",
+            type(self._analyzer.tokenizer).__name__,
+            self._analyzer.tokenizer.scan,
+            normalized,
+        )
+        return self._timed(
+            "segment",
+            type(self._analyzer.segmenter).__name__,
+            self._analyzer.segment,
+            normalized,
+            coarse,
         )
 
+    def _project(self, tokens: Sequence[TextToken]) -> Dict[Language, LanguageProjection]:
+        return {
+            language: self._projector.build(tokens, target=language)
+            for language in (Language.CHINESE, Language.ENGLISH)
+        }
+
+    def _process(
+        self,
+        tokens: Sequence[TextToken],
+        pronunciations: Mapping[int, Pronunciation],
+        *,
+        source_text: str,
+        validate: bool = True,
+    ) -> Dict[int, Pronunciation]:
+        pronunciations = dict(pronunciations)
         predicted_tokens = tuple(token for token in tokens if token.id in pronunciations)
         expected_alphabets = {
             Language.CHINESE: self.chinese.backend.capabilities.alphabet,
             Language.ENGLISH: self.english.backend.capabilities.alphabet,
         }
         for processor in self.chinese.processors + self.english.processors:
-            baseline = dict(pronunciations)
-            processed = processor.process(tokens, pronunciations)
-            validate_prediction(
-                producer=type(processor).__name__,
-                result=processed,
-                expected_tokens=predicted_tokens,
-                expected_alphabets=expected_alphabets,
-                source_text=text,
+            baseline = dict(pronunciations) if validate else pronunciations
+            processed = self._timed("process", type(processor).__name__, processor.process, tokens, pronunciations)
+            if validate:
+                self._timed(
+                    "validate",
+                    type(processor).__name__,
+                    self._validation.run,
+                    validate_prediction,
+                    producer=type(processor).__name__,
+                    result=processed,
+                    expected_tokens=predicted_tokens,
+                    expected_alphabets=expected_alphabets,
+                    source_text=source_text,
+                )
+                self._timed(
+                    "validate",
+                    type(processor).__name__,
+                    self._validation.run,
+                    validate_processor_identity,
+                    producer=type(processor).__name__,
+                    baseline=baseline,
+                    result=processed,
+                )
+            pronunciations = dict(processed)
+        return pronunciations
+
+    def _build_result(
+        self,
+        text: str,
+        normalized: NormalizedText,
+        tokens: Sequence[TextToken],
+        projections: Mapping[Language, LanguageProjection],
+        pronunciations: Mapping[int, Pronunciation],
+    ) -> G2PResult:
+        output = "ipa" if self.output_alphabet is PhoneAlphabet.IPA else "native"
+        if self._transcriber is not None and not isinstance(self._transcriber, IpaTranscriber):
+            # A custom transcriber only promises whole-result transcription.
+            result = G2PResult(
+                original_text=text,
+                normalized_text=normalized.text,
+                tokens=tuple(OutputToken(token=token, pronunciation=pronunciations.get(token.id)) for token in tokens),
+                projections=projections,
+                warnings=self._unknown_warnings(pronunciations, source_text=text),
             )
-            validate_processor_identity(
-                producer=type(processor).__name__,
-                baseline=baseline,
-                result=processed,
+            result = self._timed("transcribe", type(self._transcriber).__name__, self._transcriber.transcribe, result)
+            return replace(
+                result,
+                phones=self._timed("render", type(self._renderer).__name__, self._renderer.render, result),
+                output=output,
             )
-            pronunciations = dict(processed)
 
-        result = G2PResult(
-            original_text=text,
-            normalized_text=normalized.text,
-            tokens=tuple(
-                OutputToken(
-                    token=token,
-                    pronunciation=pronunciations.get(token.id),
+        if self._transcriber is not None:
+            pronunciations = self._timed(
+                "transcribe",
+                type(self._transcriber).__name__,
+                lambda: {
+                    token_id: self._transcriber.transcribe_pronunciation(pronunciation)
+                    for token_id, pronunciation in pronunciations.items()
+                },
+            )
+        return self._assemble(
+            text,
+            normalized.text,
+            tuple(OutputToken(token=token, pronunciation=pronunciations.get(token.id)) for token in tokens),
+            output,
+        )
+
+    def offset_result(
+        self,
+        result: G2PResult,
+        *,
+        source_offset: int,
+        normalized_offset: int = 0,
+        token_offset: int = 0,
+    ) -> G2PResult:
+        """Move the spans and token IDs of a piece of a longer text into that text's coordinates.
+
+        ``original_text`` stays the piece itself, so its source spans no longer
+        index it once ``source_offset`` is non-zero.
+        """
+
+        if not (source_offset or normalized_offset or token_offset):
+            return result
+
+        def spans(values: Tuple[Span, ...]) -> Tuple[Span, ...]:
+            return tuple(Span(span.start + source_offset, span.end + source_offset) for span in values)
+
+        output_tokens = []
+        for output in result.tokens:
+            token = replace(
+                output.token,
+                id=output.token.id + token_offset,
+                normalized_span=Span(
+                    output.token.normalized_span.start + normalized_offset,
+                    output.token.normalized_span.end + normalized_offset,
+                ),
+                source_spans=spans(output.token.source_spans),
+            )
+            pronunciation = output.pronunciation
+            if pronunciation is not None:
+                pronunciation = replace(
+                    pronunciation,
+                    token_id=token.id,
+                    units=tuple(replace(unit, source_spans=spans(unit.source_spans)) for unit in pronunciation.units),
                 )
-                for token in tokens
-            ),
-            projections=projections,
-            warnings=self._unknown_warnings(
-                pronunciations,
-                source_text=text,
-            ),
+            output_tokens.append(OutputToken(token=token, pronunciation=pronunciation))
+        return self._assemble(
+            result.original_text,
+            result.normalized_text,
+            tuple(output_tokens),
+            result.output,
+            source_offset=source_offset,
         )
-        if self._transcriber is not None:
-            result = self._transcriber.transcribe(result)
-        return replace(
-            result,
-            phones=self._renderer.render(result),
-            output="ipa" if self.output_alphabet is PhoneAlphabet.IPA else "native",
+
+    def join_results(self, text: str, pieces: Sequence[Tuple[int, G2PResult]]) -> G2PResult:
+        """Stitch results of consecutive sentences of ``text`` into one result.
+
+        ``pieces`` pairs each sentence result with the offset of its sentence
+        in ``text``. Token IDs, normalized spans and source spans are moved
+        into the coordinates of the whole text, and the first token of each
+        later sentence gets the sentence boundary the tokenizer would give it.
+        Whitespace of ``text`` between two pieces becomes a space token.
+        """
+
+        output_tokens: List[OutputToken] = []
+        normalized: List[str] = []
+        normalized_offset = 0
+        end = 0
+        for index, (offset, piece) in enumerate(pieces):
+            if offset > end:
+                gap = text[end:offset]
+                output_tokens.append(
+                    OutputToken(
+                        token=TextToken(
+                            id=len(output_tokens),
+                            text=gap,
+                            normalized_span=Span(normalized_offset, normalized_offset + len(gap)),
+                            source_spans=tuple(Span(position, position + 1) for position in range(end, offset)),
+                            language=Language.SPACE,
+                            kind=TokenKind.SPACE,
+                        ),
+                        pronunciation=None,
+                    )
+                )
+                normalized.append(gap)
+                normalized_offset += len(gap)
+            end = offset + len(piece.original_text)
+            shifted = self.offset_result(
+                piece,
+                source_offset=offset,
+                normalized_offset=normalized_offset,
+                token_offset=len(output_tokens),
+            )
+            tokens = list(shifted.tokens)
+            if index and tokens and tokens[0].token.language is not Language.SPACE:
+                tokens[0] = replace(tokens[0], token=replace(tokens[0].token, boundary_before=Boundary.SENTENCE))
+            output_tokens.extend(tokens)
+            normalized.append(piece.normalized_text)
+            normalized_offset += len(piece.normalized_text)
+        return self._assemble(
+            text,
+            "".join(normalized),
+            tuple(output_tokens),
+            "ipa" if self.output_alphabet is PhoneAlphabet.IPA else "native",
+        )
+
+    def _assemble(
+        self,
+        text: str,
+        normalized_text: str,
+        output_tokens: Tuple[OutputToken, ...],
+        output: str,
+        *,
+        source_offset: int = 0,
+    ) -> G2PResult:
+        # Projections are rebuilt from the tokens on access rather than kept
+        # alive for every result; warnings and phones are derived on demand.
+        # With a stage hook the phones are rendered now, so the render timing
+        # belongs to this conversion whether or not the caller reads them.
+        if self._on_stage is None:
+            phones = Deferred(partial(self._render_output, output_tokens))
+        else:
+            phones = self._timed("render", type(self._renderer).__name__, self._render_output, output_tokens)
+        return G2PResult(
+            original_text=text,
+            normalized_text=normalized_text,
+            tokens=output_tokens,
+            projections=Deferred(partial(self._project, tuple(output.token for output in output_tokens))),
+            warnings=Deferred(partial(self._output_warnings, output_tokens, text, source_offset)),
+            phones=phones,
+            output=output,
+        )
+
+    def _output_warnings(
+        self,
+        output_tokens: Sequence[OutputToken],
+        text: str,
+        source_offset: int = 0,
+    ) -> Tuple[str, ...]:
+        return self._unknown_warnings(
+            {output.token.id: output.pronunciation for output in output_tokens if output.pronunciation is not None},
+            source_text=text,
+            source_offset=source_offset,
+        )
+
+    def _render_output(self, output_tokens: Sequence[OutputToken]) -> Tuple[str, ...]:
+        return tuple(
+            phone
+            for output in output_tokens
+            if output.pronunciation is not None
+            for unit in output.pronunciation.units
+            for phone in self._renderer.render_unit(unit)
         )
 
+    def _render_phones(
+        self,
+        text: str,
+        normalized: NormalizedText,
+        tokens: Sequence[TextToken],
+        projections: Mapping[Language, LanguageProjection],
+        pronunciations: Mapping[int, Pronunciation],
+    ) -> Tuple[str, ...]:
+        if self._transcriber is not None and not isinstance(self._transcriber, IpaTranscriber):
+            # A custom transcriber only promises whole-result transcription.
+            return self._build_result(text, normalized, tokens, projections, pronunciations).phones
+        return self._timed("render", type(self._renderer).__name__, self._render_units, tokens, pronunciations)
+
+    def _render_units(
+        self,
+        tokens: Sequence[TextToken],
+        pronunciations: Mapping[int, Pronunciation],
+    ) -> Tuple[str, ...]:
+        phones: List[str] = []
+        for token in tokens:
+            pronunciation = pronunciations.get(token.id)
+            if pronunciation is None:
+                continue
+            for unit in pronunciation.units:
+                if self._transcriber is None:
+                    phones.extend(self._renderer.render_unit(unit))
+                elif not unit.is_unknown:
+                    ipa_phones, contour, stress_marks = self._transcriber.transcribe_phones(unit)
+                    phones.extend(IpaRenderer.render_phones(ipa_phones, stress_marks, contour))
+        return tuple(phones)
+
     def _predict(
         self,
         profile: Union[ChineseProfile, EnglishProfile],
         tokens: Sequence[TextToken],
         projection: LanguageProjection,
         source_text: str,
+        validate: bool = True,
     ) -> Mapping[int, Pronunciation]:
-        target_tokens = tuple(token for token in tokens if token.language is projection.target)
-        if not target_tokens:
+        request = self._request(profile, tokens, projection)
+        if request is None:
             return {}
+        predicted = self._timed("predict", profile.backend.name, profile.backend.predict, request)
+        return self._validate_prediction(profile, request, predicted, source_text, validate)
+
+    def _predict_batch(
+        self,
+        results: List[Optional[Union[object, G2PError]]],
+        profile: Union[ChineseProfile, EnglishProfile],
+        items: Mapping[int, Tuple[Sequence[TextToken], LanguageProjection, str]],
+        validate: Sequence[bool],
+    ) -> Dict[int, Mapping[int, Pronunciation]]:
+        requests = {
+            index: self._request(profile, tokens, projection) for index, (tokens, projection, _) in items.items()
+        }
+        pending = {index: request for index, request in requests.items() if request is not None}
+        predicted = None
+        if len(pending) > 1 and hasattr(profile.backend, "predict_batch"):
+            try:
+                batch = self._timed(
+                    "predict",
+                    profile.backend.name,
+                    predict_batch,
+                    profile.backend,
+                    tuple(pending.values()),
+                    items=len(pending),
+                )
+                predicted = dict(zip(pending, batch))
+            except G2PError:
+                # Retry one request at a time so only the failing items carry the error.
+                pass
+        if predicted is None:
+            predicted = self._run_stage(
+                results,
+                pending,
+                lambda index: self._timed("predict", profile.backend.name, profile.backend.predict, pending[index]),
+            )
 
-        request = PronunciationRequest(
+        validated = self._run_stage(
+            results,
+            predicted,
+            lambda index: self._validate_prediction(
+                profile,
+                pending[index],
+                predicted[index],
+                items[index][2],
+                validate[index],
+            ),
+        )
+        return {
+            index: validated[index] if index in pending else {}
+            for index in items
+            if index in validated or index not in pending
+        }
+
+    @staticmethod
+    def _request(
+        profile: Union[ChineseProfile, EnglishProfile],
+        tokens: Sequence[TextToken],
+        projection: LanguageProjection,
+    ) -> Optional[PronunciationRequest]:
+        if not any(token.language is projection.target for token in tokens):
+            return None
+        return PronunciationRequest(
             tokens=tuple(tokens),
             projection=projection,
             dialect=getattr(profile, "dialect", None),
         )
-        result = profile.backend.predict(request)
-        validate_prediction(
-            producer=profile.backend.name,
-            result=result,
-            expected_tokens=target_tokens,
-            expected_alphabets={
-                projection.target: profile.backend.capabilities.alphabet,
-            },
-            source_text=source_text,
-        )
+
+    def _validate_prediction(
+        self,
+        profile: Union[ChineseProfile, EnglishProfile],
+        request: PronunciationRequest,
+        result: Mapping[int, Pronunciation],
+        source_text: str,
+        validate: bool = True,
+    ) -> Mapping[int, Pronunciation]:
+        if validate:
+            self._timed(
+                "validate",
+                profile.backend.name,
+                self._validation.run,
+                validate_prediction,
+                producer=profile.backend.name,
+                result=result,
+                expected_tokens=request.target_tokens,
+                expected_alphabets={
+                    request.projection.target: profile.backend.capabilities.alphabet,
+                },
+                source_text=source_text,
+            )
         return dict(result)
 
     @staticmethod
@@ -166,6 +811,7 @@ class G2PPipeline:
         pronunciations: Mapping[int, Pronunciation],
         *,
         source_text: str,
+        source_offset: int = 0,
     ) -> Tuple[str, ...]:
         warnings = []
         for pronunciation in pronunciations.values():
@@ -173,7 +819,9 @@ class G2PPipeline:
                 if not unit.is_unknown:
                     continue
                 spans = ", ".join(f"[{span.start}, {span.end})" for span in unit.source_spans)
-                source = "".join(span.slice(source_text) for span in unit.source_spans)
+                source = "".join(
+                    source_text[span.start - source_offset : span.end - source_offset] for span in unit.source_spans
+                )
                 warnings.append(
                     f"{pronunciation.backend} preserved unknown character "
                     f"{unit.text!r} (source={source!r}, spans={spans}) "
@@ -24,10 +24,10 @@ from .text import (
 )
 
 
-def _default_normalizers(*, traditional: bool = False) -> Tuple[TextNormalizer, ...]:
+def _default_normalizers(*, traditional: bool = False, windowed: bool = False) -> Tuple[TextNormalizer, ...]:
     normalizers = [
         UnicodeCompatibilityNormalizer(),
-        WeTextNormalizer(),
+        WeTextNormalizer(windowed=windowed),
     ]
     if traditional:
         normalizers.append(TraditionalChineseNormalizer())
@@ -56,12 +56,13 @@ class MandarinProfile(ChineseProfile):
         backend=None,
         *,
         tone_sandhi: bool = True,
+        windowed_normalization: bool = False,
     ) -> None:
         super().__init__(
             dialect=ChineseDialect.MANDARIN,
             backend=PypinyinBackend() if backend is None else backend,
             segmenter=JiebaSegmenter(),
-            normalizers=_default_normalizers(),
+            normalizers=_default_normalizers(windowed=windowed_normalization),
             processors=(MandarinToneSandhi(),) if tone_sandhi else (),
         )
 
@@ -73,12 +74,13 @@ class CantoneseProfile(ChineseProfile):
         *,
         traditional: bool = True,
         tagset: str = "universal",
+        windowed_normalization: bool = False,
     ) -> None:
         super().__init__(
             dialect=ChineseDialect.CANTONESE,
             backend=ToJyutpingBackend() if backend is None else backend,
             segmenter=PyCantoneseSegmenter(tagset=tagset),
-            normalizers=_default_normalizers(traditional=traditional),
+            normalizers=_default_normalizers(traditional=traditional, windowed=windowed_normalization),
             processors=(),
         )
 
@@ -41,13 +41,21 @@ class IpaRenderer:
                 f"text={unit.text!r}, source_spans={spans!r}"
             )
 
-        phones = list(unit.phones)
-        for index, stress in unit.stress_marks:
+        return self.render_phones(unit.phones, unit.stress_marks, unit.tone_contour)
+
+    @staticmethod
+    def render_phones(
+        phones: Tuple[str, ...],
+        stress_marks: Tuple[Tuple[int, int], ...],
+        tone_contour: Tuple[int, ...],
+    ) -> Tuple[str, ...]:
+        rendered = list(phones)
+        for index, stress in stress_marks:
             if stress in {1, 2}:
-                phones[index] = {1: "ˈ", 2: "ˌ"}[stress] + phones[index]
-        if unit.tone_contour:
-            phones[-1] += render_tone_contour(unit.tone_contour)
-        return tuple(phones)
+                rendered[index] = {1: "ˈ", 2: "ˌ"}[stress] + rendered[index]
+        if tone_contour:
+            rendered[-1] += render_tone_contour(tone_contour)
+        return tuple(rendered)
 
     def render(self, result: G2PResult) -> Tuple[str, ...]:
         return _render_result(result, self.render_unit)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from functools import lru_cache
+import os
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache, wraps
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from threading import Condition, Lock, get_ident
-from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from threading import Condition, Event, Lock, Thread, get_ident
+from time import perf_counter
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
 
-from .errors import BackendError
+from .errors import BackendError, G2PError
 
 PACKAGE_DIR = Path(__file__).resolve().parent
 DICT_DIR = PACKAGE_DIR / "dict"
@@ -17,6 +23,226 @@ _JIEBA_INSTALL_INSTALLED = "installed"
 _JIEBA_PHRASE_INSTALL_CONDITION = Condition()
 _NLTK_DATA_PATH_LOCK = Lock()
 
+# ``(name, load)``, or ``(name, load, True)`` for an optional resource whose
+# failure is reported without failing the load.
+WarmupStep = Union[Tuple[str, Callable[[], object]], Tuple[str, Callable[[], object], bool]]
+_FINGERPRINT_DISTRIBUTIONS = (
+    "g2p-mix",
+    "g2p-en",
+    "g2pw",
+    "jieba",
+    "nltk",
+    "pycantonese",
+    "pyopenhc",
+    "pypinyin",
+    "ToJyutping",
+    "wetext",
+    "wordsegment",
+)
+
+
+@dataclass(frozen=True)
+class ResourceLoad:
+    """Outcome of one warmup step.
+
+    ``memory_delta`` is the change in resident memory in bytes, or ``None``
+    where the platform does not report it. An ``optional`` resource only
+    serves some inputs, so its failure does not fail the load.
+    """
+
+    name: str
+    seconds: float
+    memory_delta: Optional[int]
+    error: Optional[str] = None
+    optional: bool = False
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    resources: Tuple[ResourceLoad, ...]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every required resource loaded."""
+
+        return all(resource.error is None for resource in self.resources if not resource.optional)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every resource, optional ones included, loaded."""
+
+        return all(resource.error is None for resource in self.resources)
+
+    @property
+    def seconds(self) -> float:
+        return sum(resource.seconds for resource in self.resources)
+
+
+def run_warmup(steps: Tuple[WarmupStep, ...]) -> WarmupReport:
+    """Run warmup steps in order, recording package errors instead of stopping at the first."""
+
+    loads = []
+    for step in steps:
+        name, load = step[:2]
+        optional = len(step) > 2 and bool(step[2])
+        memory_before = _resident_memory()
+        start = perf_counter()
+        error = None
+        try:
+            load()
+        except G2PError as failure:
+            error = str(failure)
+        seconds = perf_counter() - start
+        memory_after = _resident_memory()
+        memory_delta = None if memory_before is None or memory_after is None else memory_after - memory_before
+        loads.append(
+            ResourceLoad(name=name, seconds=seconds, memory_delta=memory_delta, error=error, optional=optional)
+        )
+    return WarmupReport(tuple(loads))
+
+
+class LoadState(str, Enum):
+    IDLE = "idle"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class ResourceLoader:
+    """Run warmup steps in the foreground or on a daemon thread and track the load state.
+
+    The state moves from ``idle`` to ``loading`` and then to ``ready``, or to
+    ``failed`` when a required step reports an error. A ``load`` call made
+    while another load runs waits for it and shares its report.
+    """
+
+    def __init__(self, steps: Callable[[], Tuple[WarmupStep, ...]]) -> None:
+        self._steps = steps
+        self._lock = Lock()
+        self._finished = Event()
+        self._state = LoadState.IDLE
+        self._report: Optional[WarmupReport] = None
+        self._running: Optional[Event] = None
+        self._failure: Optional[BaseException] = None
+
+    @property
+    def state(self) -> LoadState:
+        return self._state
+
+    @property
+    def report(self) -> Optional[WarmupReport]:
+        return self._report
+
+    def ready(self) -> bool:
+        return self._state is LoadState.READY
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a started load to finish and return whether it succeeded."""
+
+        if self._state is not LoadState.IDLE:
+            self._finished.wait(timeout)
+        return self.ready()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._state is not LoadState.IDLE:
+                return
+            running = self._claim()
+        Thread(target=self._run, args=(running,), name="g2p-mix-warmup", daemon=True).start()
+
+    def load(self) -> WarmupReport:
+        with self._lock:
+            running = self._running
+            if running is None:
+                running = self._claim()
+                owner = True
+            else:
+                owner = False
+        if owner:
+            return self._run(running)
+        running.wait()
+        with self._lock:
+            if self._report is None:
+                raise self._failure
+            return self._report
+
+    def _claim(self) -> Event:
+        # Called with the lock held; a finished loader keeps its state while it reloads.
+        if self._state is LoadState.IDLE:
+            self._state = LoadState.LOADING
+        self._running = Event()
+        return self._running
+
+    def _run(self, running: Event) -> WarmupReport:
+        report = None
+        try:
+            report = run_warmup(self._steps())
+            return report
+        except BaseException as error:
+            self._failure = error
+            raise
+        finally:
+            with self._lock:
+                self._report = report
+                self._state = LoadState.READY if report is not None and report.ok else LoadState.FAILED
+                self._running = None
+            self._finished.set()
+            running.set()
+
+
+def _resident_memory() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class InitializationLock:
+    """Serialize a lazy initializer; pickles and copies as a fresh, unlocked lock."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+
+    def __enter__(self) -> bool:
+        return self._lock.acquire()
+
+    def __exit__(self, *exc_info) -> None:
+        self._lock.release()
+
+    def __reduce__(self):
+        return (InitializationLock, ())
+
+
+def single_flight(loader):
+    """Let concurrent first calls of an ``lru_cache`` loader share one load.
+
+    Loaded values are returned without taking the lock.
+    """
+
+    lock = Lock()
+    loaded = {}
+
+    @wraps(loader)
+    def load(*args):
+        try:
+            return loaded[args]
+        except KeyError:
+            pass
+        with lock:
+            value = loader(*args)
+            loaded[args] = value
+            return value
+
+    def cache_clear() -> None:
+        with lock:
+            loaded.clear()
+            loader.cache_clear()
+
+    load.cache_clear = cache_clear
+    load.cache_info = loader.cache_info
+    return load
+
 
 class _JiebaPhraseInstallState(NamedTuple):
     status: str
@@ -28,6 +254,30 @@ class _JiebaPhraseInstallState(NamedTuple):
 _jieba_phrase_install_state = _JiebaPhraseInstallState(_JIEBA_INSTALL_PENDING, None, 0, None)
 
 
+def component_warmup_steps(component: object) -> Tuple[WarmupStep, ...]:
+    """Return the named lazy loaders of a component that opts into warmup."""
+
+    steps = getattr(component, "warmup_steps", None)
+    return tuple(steps()) if steps is not None else ()
+
+
+@lru_cache(maxsize=1)
+def resource_fingerprint() -> str:
+    """Digest the bundled dictionaries and the installed versions of the packages that produce results."""
+
+    digest = hashlib.sha256()
+    for path in sorted(DICT_DIR.iterdir()):
+        if path.is_file():
+            digest.update(path.name.encode("utf-8") + b"\0" + path.read_bytes() + b"\0")
+    for name in _FINGERPRINT_DISTRIBUTIONS:
+        try:
+            installed = version(name)
+        except PackageNotFoundError:
+            installed = ""
+        digest.update(f"{name}={installed}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
 @lru_cache(maxsize=None)
 def load_json(name: str) -> dict:
     with (DICT_DIR / name).open(encoding="utf-8") as source:
@@ -67,6 +317,7 @@ def ensure_bundled_nltk_data() -> None:
         nltk.data.path.append(path)
 
 
+@single_flight
 @lru_cache(maxsize=1)
 def load_cmudict() -> Dict[str, List[List[str]]]:
     ensure_bundled_nltk_data()
@@ -149,6 +400,7 @@ def install_jieba_phrases() -> FrozenSet[str]:
     return installed
 
 
+@single_flight
 @lru_cache(maxsize=1)
 def install_pypinyin_overrides() -> None:
     from pypinyin import load_phrases_dict, load_single_dict
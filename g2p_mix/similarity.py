@@ -9,9 +9,11 @@ from typing import Protocol, Sequence
 
 from .errors import SimilarityError
 from .models import G2PResult, Pronunciation, PronunciationUnit
+from .resources import single_flight
 from .transcription import IpaTranscriber
 
 
+@single_flight
 @lru_cache(maxsize=1)
 def _load_panphon_distance():
     try:
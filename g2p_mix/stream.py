@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from .models import G2PResult
+from .text.document import CLAUSE_END, split_text
+
+if TYPE_CHECKING:
+    from .api import G2P
+
+
+class G2PStream:
+    """Convert text that arrives in pieces, one clause at a time.
+
+    ``feed`` returns results for the clauses whose sentence or pause mark is
+    confirmed by the text that follows it; the unfinished tail is held back so
+    normalization, segmentation and tone sandhi see the whole clause. ``flush``
+    converts the tail at the end of the stream. Each result's
+    ``original_text`` is its clause, while its source spans index everything
+    fed so far.
+    """
+
+    def __init__(self, converter: G2P) -> None:
+        self._converter = converter
+        self._pending = ""
+        self._offset = 0
+
+    @property
+    def pending(self) -> str:
+        """Text fed but not yet converted."""
+
+        return self._pending
+
+    def feed(self, chunk: str) -> List[G2PResult]:
+        if not isinstance(chunk, str):
+            raise TypeError("chunk must be a string")
+        self._pending += chunk
+        return self._convert(final=False)
+
+    def flush(self) -> List[G2PResult]:
+        """Convert the held-back tail; the stream can then continue with new text."""
+
+        return self._convert(final=True)
+
+    def _convert(self, *, final: bool) -> List[G2PResult]:
+        results = []
+        consumed = 0
+        for start, clause in split_text(self._pending, CLAUSE_END, final=final):
+            results.append(self._converter.convert(clause, offset=self._offset + start))
+            consumed = start + len(clause)
+        self._offset += consumed
+        self._pending = self._pending[consumed:]
+        return results
@@ -1,3 +1,4 @@
+from .document import iter_sentences, split_sentences
 from .normalizers import (
     AsciiLatinValidator,
     IdentityNormalizer,
@@ -30,4 +31,6 @@ __all__ = [
     "TraditionalChineseNormalizer",
     "UnicodeCompatibilityNormalizer",
     "WeTextNormalizer",
+    "iter_sentences",
+    "split_sentences",
 ]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import codecs
+import io
+import mmap
+import os
+import re
+import stat
+from typing import IO, Iterator, Tuple, Union
+
+from .tokenizer import PAUSE_MARKS, SENTENCE_MARKS
+
+DocumentSource = Union[str, os.PathLike, IO[str], IO[bytes]]
+
+
+# Python's str ``\s``; every such character is below U+3001. Spelled out so
+# the bytes pattern used on memory-mapped files matches the same whitespace.
+_WHITESPACE = "".join(char for char in map(chr, range(0x3001)) if char.isspace())
+
+
+def _either(chars: str) -> str:
+    return "(?:" + "|".join(re.escape(char) for char in sorted(chars)) + ")"
+
+
+def _boundary(marks: str) -> str:
+    # A run of marks ends a piece, unless it ends in an ASCII mark followed
+    # directly by an ASCII letter or digit, which keeps numbers such as 1.0 or
+    # 3,000 intact. Full-width marks always end a piece, and an abbreviation
+    # such as "Dr. " does too. Trailing whitespace stays with the piece so
+    # pieces join losslessly. The pattern uses only alternations, so its UTF-8
+    # encoding is the same pattern over bytes.
+    mark = _either(marks)
+    full_width = "".join(f"(?<={re.escape(char)})|" for char in sorted(marks) if not char.isascii())
+    return rf"{mark}+(?:{full_width}(?!{mark}|[0-9A-Za-z])){_either(_WHITESPACE)}*"
+
+
+_MARKS = "".join(sorted(SENTENCE_MARKS))
+SENTENCE_END = re.compile(_boundary(_MARKS))
+CLAUSE_END = re.compile(_boundary("".join(sorted(SENTENCE_MARKS | PAUSE_MARKS))))
+_SENTENCE_END_BYTES = re.compile(_boundary(_MARKS).encode("utf-8"))
+_CHUNK_SIZE = 1 << 16
+
+
+def split_text(text: str, boundary: re.Pattern = SENTENCE_END, *, final: bool = True) -> Iterator[Tuple[int, str]]:
+    """Yield ``(offset, piece)`` pieces of ``text`` ending at ``boundary`` matches.
+
+    With ``final`` the pieces concatenate back to ``text``. Otherwise more text
+    may follow, so only pieces whose boundary can no longer grow are yielded.
+    """
+
+    start = 0
+    for match in boundary.finditer(text):
+        if not final and match.end() == len(text):
+            break
+        yield start, text[start : match.end()]
+        start = match.end()
+    if final and start < len(text):
+        yield start, text[start:]
+
+
+def split_sentences(text: str) -> Iterator[Tuple[int, str]]:
+    """Yield ``(offset, sentence)`` pieces of ``text`` that concatenate back to it."""
+
+    return split_text(text)
+
+
+def iter_sentences(source: DocumentSource, encoding: str = "utf-8") -> Iterator[Tuple[int, str]]:
+    """Yield ``(offset, sentence)`` pieces of a string, text or binary file, or path.
+
+    Offsets count characters from where reading starts. Paths and regular
+    binary files at their start are memory-mapped when ``encoding`` is UTF-8;
+    other files, pipes included, are read in chunks from their current
+    position, so only the current sentence is decoded.
+    """
+
+    if isinstance(source, str):
+        yield from split_sentences(source)
+    elif isinstance(source, os.PathLike):
+        with open(source, "rb") as file:
+            yield from _iter_binary(file, encoding)
+    elif isinstance(source, io.TextIOBase):
+        yield from _iter_chunks(source)
+    else:
+        yield from _iter_binary(source, encoding)
+
+
+def _iter_binary(file: IO[bytes], encoding: str) -> Iterator[Tuple[int, str]]:
+    # Only a regular file read from its start can be mapped; pipes report a
+    # size of 0, and a file the caller has seeked into continues from there.
+    try:
+        status = os.fstat(file.fileno())
+        size = status.st_size if stat.S_ISREG(status.st_mode) and file.tell() == 0 else None
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        size = None
+    codec = codecs.lookup(encoding).name
+    if size is None or codec not in {"utf-8", "utf-8-sig"}:
+        wrapper = io.TextIOWrapper(file, encoding=encoding)
+        try:
+            yield from _iter_chunks(wrapper)
+        finally:
+            # Leave the caller's file open.
+            wrapper.detach()
+        return
+    if size == 0:
+        return
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        position = 3 if codec == "utf-8-sig" and view[:3] == codecs.BOM_UTF8 else 0
+        offset = 0
+        for match in _SENTENCE_END_BYTES.finditer(view, position):
+            sentence = view[position : match.end()].decode("utf-8")
+            yield offset, sentence
+            offset += len(sentence)
+            position = match.end()
+        if position < len(view):
+            yield offset, view[position:].decode("utf-8")
+
+
+def _iter_chunks(file: IO[str]) -> Iterator[Tuple[int, str]]:
+    pending = ""
+    offset = 0
+    while True:
+        chunk = file.read(_CHUNK_SIZE)
+        pending += chunk
+        consumed = 0
+        for start, sentence in split_text(pending, final=not chunk):
+            yield offset + start, sentence
+            consumed = start + len(sentence)
+        offset += consumed
+        pending = pending[consumed:]
+        if not chunk:
+            return
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import sys
 import unicodedata
 from difflib import SequenceMatcher
-from typing import Iterable, Protocol
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Protocol, Tuple
 
 from ..errors import NormalizationError
-from ..models import NormalizedText, Span
+from ..models import NormalizedText, SourceMap, SourceMapBuilder, Span
+from ..resources import InitializationLock, WarmupStep, single_flight
+from .document import CLAUSE_END, split_text
 from .latin import fold_english_spelling
-from .unicode_script import is_combining_mark, is_latin_character
+from .unicode_script import COMBINING_MARK, LATIN, classify
 
 
 class TextNormalizer(Protocol):
@@ -23,19 +27,22 @@ class IdentityNormalizer:
 class UnicodeCompatibilityNormalizer:
     """Normalize compatibility letters and numbers without rewriting punctuation."""
 
-    def normalize(self, value: NormalizedText) -> NormalizedText:
-        characters = []
-        sources = []
-        for char, source in zip(value.text, value.char_sources):
-            converted = unicodedata.normalize("NFKC", char) if unicodedata.category(char)[:1] in {"L", "N"} else char
-            characters.append(converted)
-            sources.extend(source for _ in converted)
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("unicode-compatibility", compatibility_table),)
 
-        decomposed = NormalizedText(
-            original=value.original,
-            text="".join(characters),
-            char_sources=tuple(sources),
-        )
+    def normalize(self, value: NormalizedText) -> NormalizedText:
+        if value.text.isascii():
+            return value
+        table = compatibility_table()
+        converted = value.text.translate(table)
+        if converted == value.text:
+            if unicodedata.is_normalized("NFC", converted):
+                return value
+            decomposed = value
+        elif len(converted) == len(value.text):
+            decomposed = NormalizedText(value.original, converted, value.char_sources)
+        else:
+            decomposed = NormalizedText(value.original, converted, _expanded_sources(value, table))
         composed = unicodedata.normalize("NFC", decomposed.text)
         if composed == decomposed.text:
             return decomposed
@@ -46,47 +53,148 @@ class UnicodeCompatibilityNormalizer:
         )
 
 
+@single_flight
+@lru_cache(maxsize=1)
+def compatibility_table() -> Dict[int, str]:
+    """Map each non-ASCII letter or number to its NFKC form where that differs."""
+
+    table = {}
+    for codepoint in range(0x80, sys.maxunicode + 1):
+        char = chr(codepoint)
+        if not unicodedata.is_normalized("NFKC", char) and unicodedata.category(char)[:1] in {"L", "N"}:
+            table[codepoint] = unicodedata.normalize("NFKC", char)
+    return table
+
+
+def _expanded_sources(value: NormalizedText, table: Dict[int, str]) -> SourceMap:
+    sources = SourceMapBuilder()
+    unchanged = 0
+    for index, char in enumerate(value.text):
+        replacement = table.get(ord(char), char)
+        if len(replacement) != 1:
+            sources.extend(value.char_sources[unchanged:index])
+            sources.repeat(value.char_sources[index], len(replacement))
+            unchanged = index + 1
+    sources.extend(value.char_sources[unchanged:])
+    return sources.build()
+
+
 class WeTextNormalizer:
-    """Expand written forms while preserving their relationship to the source text."""
+    """Expand written forms while preserving their relationship to the source text.
+
+    With ``windowed`` only clauses containing digits or symbols are sent to
+    WeText, in the language WeText would detect for the whole text, and the
+    results are spliced back between the untouched clauses.
+    """
 
-    def __init__(self, normalizer=None) -> None:
+    def __init__(self, normalizer=None, *, windowed: bool = False) -> None:
         self._normalizer = normalizer
+        self._normalizer_lock = InitializationLock()
+        self._windowed = windowed
 
     def _get_normalizer(self):
         if self._normalizer is None:
-            try:
-                from wetext import Normalizer
-
-                self._normalizer = Normalizer(lang="auto", operator="tn")
-            except Exception as error:
-                raise NormalizationError("WeText normalizer initialization failed") from error
+            with self._normalizer_lock:
+                if self._normalizer is None:
+                    try:
+                        from wetext import Normalizer
+
+                        self._normalizer = Normalizer(lang="auto", operator="tn")
+                    except Exception as error:
+                        raise NormalizationError("WeText normalizer initialization failed") from error
         return self._normalizer
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("wetext", self._get_normalizer),)
+
     def normalize(self, value: NormalizedText) -> NormalizedText:
+        if self._windowed:
+            return self._normalize_windows(value)
+        converted = self._convert(value.text)
+        if converted == value.text:
+            return value
+        return NormalizedText(
+            original=value.original,
+            text=converted,
+            char_sources=_align_normalized_characters(value, converted),
+        )
+
+    def _convert(self, text: str, **options) -> str:
         try:
-            converted = self._get_normalizer().normalize(value.text)
+            converted = self._get_normalizer().normalize(text, **options)
         except NormalizationError:
             raise
         except Exception as error:
-            raise NormalizationError(f"WeText normalization failed for {value.text!r}") from error
+            raise NormalizationError(f"WeText normalization failed for {text!r}") from error
         if not isinstance(converted, str):
             raise NormalizationError("WeText normalizer returned a non-string value")
-        if converted == value.text:
+        return converted
+
+    def _normalize_windows(self, value: NormalizedText) -> NormalizedText:
+        language = _wetext_language(value.text.strip())
+        characters = []
+        sources = SourceMapBuilder()
+        for offset, clause in split_text(value.text, CLAUSE_END):
+            # WeText strips its input, so edge whitespace stays outside the window.
+            start = offset + len(clause) - len(clause.lstrip())
+            end = max(start, offset + len(clause.rstrip()))
+            window = value.text[start:end]
+            characters.append(value.text[offset:start])
+            sources.extend(value.char_sources[offset:start])
+            converted = self._convert(window, lang=language) if _has_candidate(window) else window
+            characters.append(converted)
+            if converted == window:
+                sources.extend(value.char_sources[start:end])
+            else:
+                sources.extend(
+                    _align_normalized_characters(
+                        NormalizedText(value.original, window, value.char_sources[start:end]),
+                        converted,
+                    )
+                )
+            characters.append(value.text[end : offset + len(clause)])
+            sources.extend(value.char_sources[end : offset + len(clause)])
+
+        text = "".join(characters)
+        start = len(text) - len(text.lstrip())
+        end = max(start, len(text.rstrip()))
+        if text[start:end] == value.text:
             return value
         return NormalizedText(
             original=value.original,
-            text=converted,
-            char_sources=_align_normalized_characters(value, converted),
+            text=text[start:end],
+            char_sources=sources.build(start, end),
         )
 
 
+# Characters that may start a written form WeText rewrites: digits, currency
+# and other symbols. Dates, measures and units only expand next to these.
+_CANDIDATE_MARKS = frozenset("%‰‱#&@")
+
+
+def _has_candidate(text: str) -> bool:
+    return any(
+        char in _CANDIDATE_MARKS or unicodedata.category(char) in {"Nd", "No"} or unicodedata.category(char)[0] == "S"
+        for char in text
+    )
+
+
+def _wetext_language(text: str) -> str:
+    # Mirrors WeText's automatic detection, which a single window cannot repeat.
+    if text.isdigit() or any("\u4e00" <= char <= "\u9fff" for char in text):
+        return "zh"
+    return "en"
+
+
 class AsciiLatinValidator:
     """Require Latin text to be ASCII or safely foldable for the English backend."""
 
     def normalize(self, value: NormalizedText) -> NormalizedText:
+        if value.text.isascii():
+            return value
         inside_latin_segment = False
-        for index, char in enumerate(value.text):
-            if is_latin_character(char):
+        for index, (char, script) in enumerate(zip(value.text, classify(value.text))):
+            if script == LATIN:
                 inside_latin_segment = True
                 if char.isascii():
                     continue
@@ -94,7 +202,7 @@ class AsciiLatinValidator:
                     fold_english_spelling(char)
                 except ValueError:
                     self._raise_unsupported(value, index, char)
-            elif is_combining_mark(char) and inside_latin_segment:
+            elif script == COMBINING_MARK and inside_latin_segment:
                 self._raise_unsupported(value, index, char)
             else:
                 inside_latin_segment = False
@@ -110,49 +218,137 @@ class AsciiLatinValidator:
         )
 
 
-def _align_normalized_characters(value: NormalizedText, converted: str) -> tuple[Span, ...]:
-    aligned = []
-    matcher = SequenceMatcher(a=value.text, b=converted, autojunk=False)
-    for operation, source_start, source_end, target_start, target_end in matcher.get_opcodes():
+# Texts up to ``_EXACT_LIMIT`` characters are aligned with one whole-text
+# diff, which is also the faster choice at that size. Longer texts copy
+# agreeing characters directly and diff only a bounded window after each
+# mismatch, committing its first change before the next run of ``_ANCHOR`` or
+# more agreeing characters. A run found in a truncated window may pair an
+# expansion with repeated text further on, so the window doubles until a run
+# is found again in a window twice as large or the window covers both texts.
+# This matches the whole-text diff for local rewrites such as WeText's, but
+# arbitrary edits of long, repetitive text may be paired differently.
+_EXACT_LIMIT = 256
+_ANCHOR = 4
+_WINDOW = 16
+
+
+def _align_normalized_characters(value: NormalizedText, converted: str) -> SourceMap:
+    source_text = value.text
+    aligned = SourceMapBuilder()
+    if max(len(source_text), len(converted)) <= _EXACT_LIMIT:
+        _align_window(value, converted, aligned, 0, len(source_text), 0, len(converted))
+        return aligned.build()
+    source_index = target_index = 0
+    while True:
+        agreed = source_index
+        while (
+            source_index < len(source_text)
+            and target_index < len(converted)
+            and source_text[source_index] == converted[target_index]
+        ):
+            source_index += 1
+            target_index += 1
+        aligned.extend(value.char_sources[agreed:source_index])
+        if source_index == len(source_text) or target_index == len(converted):
+            break
+        source_end, target_end = _next_change(source_text, source_index, converted, target_index)
+        _align_window(value, converted, aligned, source_index, source_end, target_index, target_end)
+        source_index, target_index = source_end, target_end
+    _align_window(value, converted, aligned, source_index, len(source_text), target_index, len(converted))
+    return aligned.build()
+
+
+def _next_change(source: str, source_start: int, target: str, target_start: int) -> tuple[int, int]:
+    """Return where the change starting at a mismatch ends and the texts agree again."""
+
+    window = _WINDOW
+    previous = None
+    while True:
+        source_end = min(len(source), source_start + window)
+        target_end = min(len(target), target_start + window)
+        complete = source_end == len(source) and target_end == len(target)
+        anchor = _first_anchor(source, source_start, source_end, target, target_start, target_end)
+        if complete or (anchor is not None and anchor == previous):
+            return anchor or (len(source), len(target))
+        previous = anchor
+        window *= 2
+
+
+def _first_anchor(
+    source: str,
+    source_start: int,
+    source_end: int,
+    target: str,
+    target_start: int,
+    target_end: int,
+) -> Optional[tuple[int, int]]:
+    matcher = SequenceMatcher(a=source[source_start:source_end], b=target[target_start:target_end], autojunk=False)
+    for source_offset, target_offset, size in matcher.get_matching_blocks():
+        if size >= _ANCHOR or (size and source_start + source_offset + size == len(source)):
+            return source_start + source_offset, target_start + target_offset
+    return None
+
+
+def _align_window(
+    value: NormalizedText,
+    converted: str,
+    aligned: SourceMapBuilder,
+    source_start: int,
+    source_end: int,
+    target_start: int,
+    target_end: int,
+) -> None:
+    if source_start == source_end and target_start == target_end:
+        return
+    matcher = SequenceMatcher(
+        a=value.text[source_start:source_end],
+        b=converted[target_start:target_end],
+        autojunk=False,
+    )
+    for (
+        operation,
+        window_source_start,
+        window_source_end,
+        window_target_start,
+        window_target_end,
+    ) in matcher.get_opcodes():
+        changed_start = source_start + window_source_start
+        changed_end = source_start + window_source_end
         if operation == "equal":
-            aligned.extend(value.char_sources[source_start:source_end])
+            aligned.extend(value.char_sources[changed_start:changed_end])
             continue
         if operation == "delete":
             continue
 
-        source = _source_span_for_change(value, source_start, source_end)
-        aligned.extend(source for _ in range(target_start, target_end))
-    return tuple(aligned)
+        source = _source_span_for_change(value, changed_start, changed_end)
+        aligned.repeat(source, window_target_end - window_target_start)
 
 
 def _source_span_for_change(value: NormalizedText, start: int, end: int) -> Span:
-    sources = value.char_sources[start:end]
-    if not sources and value.char_sources:
-        adjacent_start = max(0, start - 1)
-        adjacent_end = min(len(value.char_sources), start + 1)
-        sources = value.char_sources[adjacent_start:adjacent_end]
-    if not sources:
-        return Span(0, 0)
-    return Span(
-        min(source.start for source in sources),
-        max(source.end for source in sources),
-    )
+    sources = value.char_sources
+    return sources.cover(start, end) or sources.cover(max(0, start - 1), min(len(sources), start + 1)) or Span(0, 0)
 
 
 class TraditionalChineseNormalizer:
     def __init__(self, converter=None) -> None:
         self._converter = converter
+        self._converter_lock = InitializationLock()
 
     def _get_converter(self):
         if self._converter is None:
-            try:
-                from pyopenhc import OpenHC
-
-                self._converter = OpenHC("s2t")
-            except Exception as error:
-                raise NormalizationError("Traditional Chinese converter initialization failed") from error
+            with self._converter_lock:
+                if self._converter is None:
+                    try:
+                        from pyopenhc import OpenHC
+
+                        self._converter = OpenHC("s2t")
+                    except Exception as error:
+                        raise NormalizationError("Traditional Chinese converter initialization failed") from error
         return self._converter
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("openhc", self._get_converter),)
+
     def normalize(self, value: NormalizedText) -> NormalizedText:
         try:
             converted = self._get_converter().convert(value.text)
@@ -177,6 +373,10 @@ class NormalizationPipeline:
     def __init__(self, normalizers: Iterable[TextNormalizer] = ()) -> None:
         self._normalizers = tuple(normalizers)
 
+    @property
+    def normalizers(self) -> Tuple[TextNormalizer, ...]:
+        return self._normalizers
+
     def normalize(self, text: str) -> NormalizedText:
         value = NormalizedText.identity(text)
         for normalizer in self._normalizers:
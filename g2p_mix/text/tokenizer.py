@@ -13,7 +13,7 @@ from ..models import (
     TextToken,
     TokenKind,
 )
-from ..resources import install_jieba_phrases
+from ..resources import WarmupStep, install_jieba_phrases
 from .unicode_script import (
     COMBINING_MARK_CHARACTER_CLASS,
     HAN_CHARACTER_CLASS,
@@ -40,6 +40,18 @@ class ChineseSegmenter(Protocol):
 
 
 class JiebaSegmenter:
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (
+            ("jieba", self._initialize),
+            ("jieba-phrases", install_jieba_phrases),
+        )
+
+    @staticmethod
+    def _initialize() -> None:
+        import jieba
+
+        jieba.initialize()
+
     def segment(self, text: str) -> Sequence[Tuple[str, str]]:
         custom_phrases = install_jieba_phrases()
 
@@ -61,6 +73,9 @@ class PyCantoneseSegmenter:
             raise ValueError(f"Unsupported Cantonese tagset: {tagset!r}")
         self._tagset = tagset
 
+    def warmup_steps(self) -> Tuple[WarmupStep, ...]:
+        return (("pycantonese", lambda: self.segment("粵語")),)
+
     def segment(self, text: str) -> Sequence[Tuple[str, str]]:
         import pycantonese
 
@@ -152,8 +167,20 @@ class TextAnalyzer:
         self._segmenter = chinese_segmenter
         self._tokenizer = tokenizer or LosslessTokenizer()
 
+    @property
+    def tokenizer(self) -> LosslessTokenizer:
+        return self._tokenizer
+
+    @property
+    def segmenter(self) -> ChineseSegmenter:
+        return self._segmenter
+
     def analyze(self, value: NormalizedText) -> Tuple[TextToken, ...]:
-        coarse_tokens = self._tokenizer.scan(value)
+        return self.segment(value, self._tokenizer.scan(value))
+
+    def segment(self, value: NormalizedText, coarse_tokens: Sequence[TextToken]) -> Tuple[TextToken, ...]:
+        """Split the Chinese runs of ``LosslessTokenizer.scan`` output into words."""
+
         analyzed: List[TextToken] = []
 
         for coarse in coarse_tokens:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from typing import Sequence, Tuple
 
 CodepointRange = Tuple[int, int]
@@ -79,20 +80,71 @@ COMBINING_MARK_RANGES: Tuple[CodepointRange, ...] = (
 )
 
 
-def _contains(codepoint: int, ranges: Sequence[CodepointRange]) -> bool:
-    return any(start <= codepoint <= end for start, end in ranges)
+# Per-codepoint script codes, derived from the tables above.
+OTHER = 0
+HAN = 1
+LATIN = 2
+COMBINING_MARK = 3
+
+_SCRIPT_RANGES = (
+    (HAN, HAN_CODEPOINT_RANGES),
+    (LATIN, LATIN_CODEPOINT_RANGES),
+    (COMBINING_MARK, COMBINING_MARK_RANGES),
+)
+_BMP_SIZE = 0x10000
+
+
+def _build_classification() -> Tuple[bytes, Tuple[int, ...], Tuple[int, ...], bytes]:
+    # One code per BMP codepoint; supplementary ranges are searched with bisect.
+    bmp = bytearray(_BMP_SIZE)
+    supplementary = []
+    for code, ranges in _SCRIPT_RANGES:
+        for start, end in ranges:
+            bmp_end = min(end, _BMP_SIZE - 1)
+            if start <= bmp_end:
+                bmp[start : bmp_end + 1] = bytes((code,)) * (bmp_end - start + 1)
+            if end >= _BMP_SIZE:
+                supplementary.append((max(start, _BMP_SIZE), end, code))
+    supplementary.sort()
+    return (
+        bytes(bmp),
+        tuple(start for start, _, _ in supplementary),
+        tuple(end for _, end, _ in supplementary),
+        bytes(code for _, _, code in supplementary),
+    )
+
+
+_BMP_SCRIPTS, _SUPPLEMENTARY_STARTS, _SUPPLEMENTARY_ENDS, _SUPPLEMENTARY_SCRIPTS = _build_classification()
+_ASCII_SCRIPTS = _BMP_SCRIPTS[:0x80] + bytes(0x80)
+
+
+def script_of(codepoint: int) -> int:
+    if codepoint < _BMP_SIZE:
+        return _BMP_SCRIPTS[codepoint]
+    index = bisect_right(_SUPPLEMENTARY_STARTS, codepoint) - 1
+    if index >= 0 and codepoint <= _SUPPLEMENTARY_ENDS[index]:
+        return _SUPPLEMENTARY_SCRIPTS[index]
+    return OTHER
+
+
+def classify(text: str) -> bytes:
+    """Return the script code of every character of ``text``."""
+
+    if text.isascii():
+        return text.encode("ascii").translate(_ASCII_SCRIPTS)
+    return bytes(script_of(ord(char)) for char in text)
 
 
 def is_han_character(value: str) -> bool:
-    return len(value) == 1 and _contains(ord(value), HAN_CODEPOINT_RANGES)
+    return len(value) == 1 and script_of(ord(value)) == HAN
 
 
 def is_latin_character(value: str) -> bool:
-    return len(value) == 1 and _contains(ord(value), LATIN_CODEPOINT_RANGES)
+    return len(value) == 1 and script_of(ord(value)) == LATIN
 
 
 def is_combining_mark(value: str) -> bool:
-    return len(value) == 1 and _contains(ord(value), COMBINING_MARK_RANGES)
+    return len(value) == 1 and script_of(ord(value)) == COMBINING_MARK
 
 
 def _regex_character_class(ranges: Sequence[CodepointRange]) -> str:
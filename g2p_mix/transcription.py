@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import replace
-from typing import Protocol
+from typing import Protocol, Tuple
 
 from .errors import TranscriptionError
 from .models import (
@@ -40,6 +40,25 @@ class IpaTranscriber:
                 source_alphabet=unit.alphabet,
             )
 
+        phones, contour, stress_marks = self.transcribe_phones(unit)
+        return replace(
+            unit,
+            phones=phones,
+            alphabet=PhoneAlphabet.IPA,
+            source_alphabet=unit.source_alphabet or unit.alphabet,
+            source_phones=unit.source_phones or unit.phones,
+            tone_contour=contour,
+            stress_marks=stress_marks,
+        )
+
+    def transcribe_phones(
+        self,
+        unit: PronunciationUnit,
+    ) -> Tuple[Tuple[str, ...], Tuple[int, ...], Tuple[Tuple[int, int], ...]]:
+        """Return the IPA phones, tone contour and stress marks of a known unit without building a new unit."""
+
+        if unit.alphabet is PhoneAlphabet.IPA:
+            return unit.phones, unit.tone_contour, unit.stress_marks
         try:
             if unit.alphabet is PhoneAlphabet.PINYIN:
                 initial, final = canonical_pinyin_phones(unit.phones)
@@ -63,16 +82,7 @@ class IpaTranscriber:
                 f"alphabet={unit.alphabet.value!r}, native={unit.native!r}, "
                 f"text={unit.text!r}, source_spans={spans!r}"
             ) from error
-
-        return replace(
-            unit,
-            phones=phones,
-            alphabet=PhoneAlphabet.IPA,
-            source_alphabet=unit.source_alphabet or unit.alphabet,
-            source_phones=unit.source_phones or unit.phones,
-            tone_contour=contour,
-            stress_marks=stress_marks,
-        )
+        return phones, contour, stress_marks
 
     def transcribe_pronunciation(self, pronunciation: Pronunciation) -> Pronunciation:
         return replace(
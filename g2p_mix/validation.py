@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Mapping as MappingABC
-from typing import Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Callable, Mapping, Sequence
 
 from .errors import AlignmentError
 from .models import Language, PhoneAlphabet, Pronunciation, PronunciationUnit, Span, TextToken
@@ -9,6 +12,72 @@ from .phonetics import canonical_pinyin_phones, split_jyutping, split_pinyin, tr
 from .renderers import NativeRenderer
 
 
+class ValidationMode(str, Enum):
+    FULL = "full"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+@dataclass(frozen=True)
+class ValidationStats:
+    conversions: int
+    validated: int
+    violations: int
+
+
+class ValidationPolicy:
+    """Decide which conversions run the contract checks and count what they find.
+
+    ``sampled`` validates one conversion in every ``interval``. A violation is
+    counted and still raised, because the offending result breaks the contract
+    that later stages rely on.
+    """
+
+    def __init__(self, mode: ValidationMode = ValidationMode.FULL, interval: int = 100) -> None:
+        if isinstance(interval, bool) or not isinstance(interval, int) or interval < 1:
+            raise ValueError("interval must be a positive integer")
+        self.mode = ValidationMode(mode)
+        self.interval = interval
+        self._lock = Lock()
+        self._conversions = 0
+        self._validated = 0
+        self._violations = 0
+
+    def __reduce__(self):
+        return (ValidationPolicy, (self.mode, self.interval))
+
+    def sample(self) -> bool:
+        """Count one conversion and return whether it should be validated."""
+
+        with self._lock:
+            self._conversions += 1
+            if self.mode is ValidationMode.FULL:
+                selected = True
+            elif self.mode is ValidationMode.OFF:
+                selected = False
+            else:
+                selected = (self._conversions - 1) % self.interval == 0
+            if selected:
+                self._validated += 1
+            return selected
+
+    def run(self, check: Callable[..., None], **arguments) -> None:
+        try:
+            check(**arguments)
+        except AlignmentError:
+            with self._lock:
+                self._violations += 1
+            raise
+
+    def stats(self) -> ValidationStats:
+        with self._lock:
+            return ValidationStats(
+                conversions=self._conversions,
+                validated=self._validated,
+                violations=self._violations,
+            )
+
+
 def validate_prediction(
     *,
     producer: str,
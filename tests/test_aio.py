@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+
+from g2p_mix import G2P, G2PError
+from g2p_mix.aio import AsyncG2P
+
+
+class RecordingConverter:
+    def __init__(self):
+        self.batches = []
+
+    def convert_batch(self, texts):
+        self.batches.append(list(texts))
+        return [text.upper() for text in texts]
+
+
+def test_async_g2p_groups_concurrent_calls_into_bounded_batches():
+    converter = RecordingConverter()
+
+    async def run():
+        async with AsyncG2P(converter, max_batch_size=4) as async_g2p:
+            return await asyncio.gather(*(async_g2p(f"t{index}") for index in range(10)))
+
+    results = asyncio.run(run())
+
+    assert results == [f"T{index}" for index in range(10)]
+    assert [len(batch) for batch in converter.batches] == [4, 4, 2]
+
+
+def test_async_g2p_matches_synchronous_results_and_isolates_errors():
+    converter = G2P(tone_sandhi=False)
+    texts = ["你好 idea", "你㘃好", "版本1.0"]
+
+    async def run():
+        async with AsyncG2P(converter, max_concurrency=2) as async_g2p:
+            results = await async_g2p.convert_batch(texts)
+            with pytest.raises(G2PError):
+                await async_g2p("你㘃好")
+            with pytest.raises(TypeError, match="text must be a string"):
+                await async_g2p(None)
+            return results
+
+    results = asyncio.run(run())
+
+    assert results[0] == converter(texts[0])
+    assert isinstance(results[1], G2PError)
+    assert results[2] == converter(texts[2])
+
+
+def test_async_g2p_applies_backpressure_to_pending_texts():
+    class SlowConverter(RecordingConverter):
+        def convert_batch(self, texts):
+            time.sleep(0.02)
+            return super().convert_batch(texts)
+
+    converter = SlowConverter()
+
+    async def run():
+        async_g2p = AsyncG2P(converter, max_batch_size=2, max_pending=2)
+        waiting = [asyncio.ensure_future(async_g2p(str(index))) for index in range(8)]
+        await asyncio.sleep(0)
+        queued = async_g2p._queue.qsize()
+        results = await asyncio.gather(*waiting)
+        await async_g2p.aclose()
+        return queued, results
+
+    queued, results = asyncio.run(run())
+
+    assert queued <= 2
+    assert results == [str(index) for index in range(8)]
+    assert all(len(batch) <= 2 for batch in converter.batches)
@@ -1,4 +1,8 @@
 import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -7,6 +11,8 @@ import g2p_mix
 from g2p_mix import G2P, G2PError, G2PResult
 from g2p_mix.backends import PypinyinBackend
 from g2p_mix.errors import ConfigurationError
+from g2p_mix.instrumentation import StageTimingCollector
+from g2p_mix.resources import LoadState
 
 CASE_FILE = Path(__file__).parent / "cases" / "transcription_similarity.json"
 CASE_GROUPS = json.loads(CASE_FILE.read_text(encoding="utf-8"))
@@ -90,3 +96,314 @@ def test_public_api_exposes_explicit_backend_fallback():
     )
 
     assert converter.backend == "g2pw->pypinyin"
+
+
+def test_batch_conversion_returns_results_and_errors_in_input_order():
+    converter = G2P(tone_sandhi=False)
+    texts = ["你好 idea", "你㘃好", "版本1.0"]
+
+    results = converter.convert_batch(texts)
+
+    assert results[0] == converter(texts[0])
+    assert isinstance(results[1], G2PError)
+    assert results[2] == converter(texts[2])
+
+
+def test_process_pool_map_returns_results_in_input_order():
+    converter = G2P(tone_sandhi=False)
+    texts = ["你好 idea", "你㘃好", "版本1.0", "你好 idea", "不错"]
+
+    results = converter.map(texts, workers=2, chunksize=2)
+
+    assert [result.phones for result in results if isinstance(result, G2PResult)] == [
+        converter(text).phones for text in texts if text != "你㘃好"
+    ]
+    assert isinstance(results[1], G2PError)
+    assert converter.map([], workers=2) == []
+    for workers in (0, -1):
+        with pytest.raises(ValueError, match="workers"):
+            converter.map(["你好"], workers=workers)
+        with pytest.raises(ValueError, match="workers"):
+            converter.convert_parallel("你好。", workers=workers)
+    assert converter._pool_workers == 2
+
+
+def test_process_pool_is_kept_between_calls_until_closed():
+    with G2P(tone_sandhi=False) as converter:
+        first = converter.map(["你好", "不错"], workers=2)
+        pool = converter._pool
+        second = converter.convert_parallel("你好。不错。", workers=2)
+
+        assert converter._pool is pool
+        assert pool._mp_context.get_start_method() == "spawn"
+        assert [result.phones for result in first] == [converter("你好").phones, converter("不错").phones]
+        assert second == converter("你好。不错。")
+
+    assert converter._pool is None
+
+
+def test_result_cache_reuses_results_and_reports_statistics():
+    converter = G2P(tone_sandhi=False, cache_size=2)
+
+    first = converter("你好 idea")
+    assert converter("你好 idea") is first
+    results = converter.convert_batch(["你好 idea", "不错", "你㘃好", "版本1.0"])
+
+    assert results[0] is first
+    assert isinstance(results[2], G2PError)
+    assert converter.cache_info() == (2, 4, 1, 2, 2)
+    assert converter("版本1.0") is results[3]
+    converter.cache_clear()
+    assert converter.cache_info() == (0, 0, 0, 2, 0)
+    assert G2P().cache_info().maxsize == 0
+    with pytest.raises(ConfigurationError, match="cache_size"):
+        G2P(cache_size=-1)
+
+
+def test_persistent_cache_reuses_results_for_the_same_fingerprint(tmp_path):
+    path = tmp_path / "results.sqlite"
+    texts = ["你好 idea", "你㘃好", "不错"]
+    expected = G2P(tone_sandhi=False, cache_path=path).convert_batch(texts)
+
+    class FailingPipeline:
+        def convert_batch(self, texts):
+            raise AssertionError(f"unexpected conversion of {texts!r}")
+
+        def __call__(self, text):
+            raise AssertionError(f"unexpected conversion of {text!r}")
+
+    reloaded = G2P(tone_sandhi=False, cache_path=path)
+    reloaded._pipeline = FailingPipeline()
+
+    assert reloaded("你好 idea") == expected[0]
+    assert reloaded.convert_batch(["不错", "你好 idea"]) == [expected[2], expected[0]]
+    with pytest.raises(AssertionError, match="你㘃好"):
+        reloaded("你㘃好")
+
+    changed = G2P(tone_sandhi=True, cache_path=path)
+    assert changed.fingerprint() != reloaded.fingerprint()
+    assert changed("不错").phones == G2P()("不错").phones
+
+    store = changed._store
+    with changed:
+        pass
+    assert changed._store is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.get_many(["不错"])
+    changed.close()
+    assert changed("不错").phones == G2P()("不错").phones
+
+
+def test_persistent_cache_requires_fingerprinted_backend_objects(tmp_path):
+    class TunedBackend(PypinyinBackend):
+        def __init__(self, setting):
+            super().__init__()
+            self.setting = setting
+
+        def fingerprint(self):
+            return self.setting
+
+    path = tmp_path / "results.sqlite"
+
+    with pytest.raises(ConfigurationError, match="fingerprint\\(\\): backend"):
+        G2P(backend=PypinyinBackend(), cache_path=path)
+    first = G2P(backend=TunedBackend("a"), cache_path=path)
+    assert first.fingerprint() == G2P(backend=TunedBackend("a")).fingerprint()
+    assert first.fingerprint() != G2P(backend=TunedBackend("b"), cache_path=path).fingerprint()
+
+
+def test_background_loading_serves_the_fallback_until_the_primary_is_loaded():
+    release = threading.Event()
+
+    class SlowBackend(PypinyinBackend):
+        name = "slow-pinyin"
+
+        def warmup_steps(self):
+            return (("slow-model", release.wait),)
+
+    converter = G2P(backend=SlowBackend(), fallback_backend="pypinyin", background_load=True, cache_size=8)
+
+    assert converter.state is LoadState.LOADING
+    assert not converter.wait_ready(timeout=0.01)
+    assert converter("你好").tokens[0].pronunciation.backend == "pypinyin"
+    assert converter.cache_info().size == 0
+
+    release.set()
+    converter.wait_ready(timeout=30)
+
+    assert converter.state is LoadState.READY
+    assert converter.warmup_report.resources[-1].name == "slow-model"
+    assert converter("你好").tokens[0].pronunciation.backend == "slow-pinyin"
+    assert G2P().state is LoadState.IDLE
+
+
+def test_fallback_analysis_is_not_cached_when_loading_finishes_mid_request():
+    release = threading.Event()
+    converters = []
+
+    class SlowBackend(PypinyinBackend):
+        name = "slow-pinyin"
+
+        def warmup_steps(self):
+            return (("slow-model", release.wait),)
+
+    class FinishingFallback(PypinyinBackend):
+        def predict(self, request):
+            release.set()
+            converters[0].wait_ready(timeout=30)
+            return super().predict(request)
+
+    converter = G2P(
+        backend=SlowBackend(),
+        fallback_backend=FinishingFallback(),
+        background_load=True,
+        normalized_cache_size=8,
+    )
+    converters.append(converter)
+
+    assert converter("你好").tokens[0].pronunciation.backend == "pypinyin"
+    assert converter.state is LoadState.READY
+    assert converter("你好").tokens[0].pronunciation.backend == "slow-pinyin"
+    assert converter.normalized_cache_info().hits == 0
+    assert converter("你好").tokens[0].pronunciation.backend == "slow-pinyin"
+    assert converter.normalized_cache_info().hits == 1
+
+
+@pytest.mark.parametrize(("mode", "output"), [("mandarin", "native"), ("mandarin", "ipa"), ("cantonese", "ipa")])
+def test_phones_fast_path_matches_full_results(mode, output):
+    converter = G2P(mode, output=output, unknown="preserve")
+    texts = ["你这个 idea，不太 make sense。", "你㘃好", "版本1.0", ""]
+
+    assert [converter.phones(text) for text in texts] == [converter(text).phones for text in texts]
+    assert converter.phones_batch(texts) == [converter(text).phones for text in texts]
+    assert isinstance(G2P().phones_batch(["你㘃好"])[0], G2PError)
+
+
+def test_phones_reads_the_result_cache_without_counting():
+    converter = G2P(tone_sandhi=False, cache_size=4)
+    cached = converter("你好")
+    info = converter.cache_info()
+
+    assert converter.phones("你好") == cached.phones
+    assert [converter.phones("不错") for _ in range(3)] == [converter("不错").phones] * 3
+    assert converter.cache_info() == (info.hits, info.misses + 1, 0, 4, 2)
+
+
+def test_document_iterator_yields_sentences_with_document_spans(tmp_path):
+    converter = G2P(unknown="preserve")
+    text = "你好 idea。版本1.0发布! 你㘃好？"
+    path = tmp_path / "chapter.txt"
+    path.write_text(text, encoding="utf-8")
+
+    results = list(converter.iter_document(path))
+
+    assert [result.original_text for result in results] == ["你好 idea。", "版本1.0发布! ", "你㘃好？"]
+    assert [phone for result in results for phone in result.phones] == list(converter(text).phones)
+    assert [unit.source_spans for result in results for unit in result.units] == [
+        unit.source_spans for unit in converter(text).units
+    ]
+    assert results[-1].warnings == converter(text).warnings
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_conversion_stitches_sentences_into_one_result(executor):
+    converter = G2P(unknown="preserve")
+    text = "你这个 idea，不太 make sense。 版本1.0发布了! \n 价格3,000元！你㘃好 好的"
+
+    result = converter.convert_parallel(text, workers=2, chunksize=1, executor=executor)
+
+    assert result == converter(text)
+    assert [token.token.id for token in result.tokens] == list(range(len(result.tokens)))
+    with pytest.raises(G2PError):
+        G2P().convert_parallel("你好。你㘃好。", executor="thread")
+
+
+def test_batches_convert_duplicate_and_normalized_duplicate_texts_once():
+    timings = StageTimingCollector()
+    converter = G2P(unknown="preserve", on_stage=timings)
+    texts = ["ABC 123 你好", "ＡＢＣ １２３ 你好", "ABC 123 你好", "2026年", "二零二六年", "你㘃好", "你㘃好"]
+
+    exact = converter.convert_batch(texts)
+    assert exact[0] is exact[2]
+    assert timings.summary()[("normalize", "WeTextNormalizer")].items == 5
+    timings.clear()
+
+    normalized = converter.convert_batch(texts, deduplicate="normalized")
+    assert timings.summary()[("segment", "JiebaSegmenter")].items == 3
+    assert normalized == [converter(text) for text in texts]
+    assert converter.phones_batch(texts, deduplicate="normalized") == [result.phones for result in normalized]
+    with pytest.raises(ConfigurationError):
+        converter.convert_batch(texts, deduplicate="none")
+
+
+def test_concurrent_identical_calls_share_one_conversion():
+    entered = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    class SlowBackend(PypinyinBackend):
+        name = "slow-pinyin"
+
+        def predict_batch(self, requests):
+            calls.append(len(requests))
+            entered.set()
+            release.wait(timeout=30)
+            return super().predict_batch(requests)
+
+    converter = G2P(backend=SlowBackend(), coalesce=True)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(converter, "你好")
+        entered.wait(timeout=30)
+        others = [executor.submit(converter, "你好") for _ in range(3)]
+        time.sleep(0.2)
+        release.set()
+        results = [first.result(), *(future.result() for future in others)]
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    assert converter("你好") is not results[0]
+    assert calls == [1, 1]
+
+
+def test_normalized_cache_reuses_analysis_with_each_callers_spans():
+    timings = StageTimingCollector()
+    converter = G2P(unknown="preserve", normalized_cache_size=16, on_stage=timings)
+    reference = G2P(unknown="preserve")
+    texts = ["ABC 123 你好", "ＡＢＣ １２３ 你好", "2026年", "二零二六年", "你㘃好"]
+
+    assert [converter(text) for text in texts] == [reference(text) for text in texts]
+    assert converter.convert_batch(texts) == [reference(text) for text in texts]
+    assert timings.summary()[("segment", "JiebaSegmenter")].items == 3
+    assert converter.normalized_cache_info().hits == 7
+    assert converter.normalized_cache_info().size == 3
+
+    converter.cache_clear()
+    assert converter.normalized_cache_info().size == 0
+
+
+def test_reused_analyses_rebuild_projections_from_each_callers_tokens():
+    converter = G2P(normalized_cache_size=16)
+    reference = G2P()
+    texts = ["你好 idea。", "  你好 idea。"]
+
+    def assert_projections_match_tokens(result, text):
+        tokens = {output.token.id: output.token for output in result.tokens}
+        for projection in result.projections.values():
+            for token in projection.tokens:
+                assert all(source_id in tokens for source_id in token.source_ids)
+        assert all(
+            "".join(span.slice(text) for span in output.token.source_spans) == output.token.text
+            for output in result.tokens
+        )
+
+    for result in (
+        *(converter(text) for text in texts),
+        *G2P().convert_batch(texts, deduplicate="normalized"),
+    ):
+        assert result.projections == reference(result.original_text).projections
+        assert_projections_match_tokens(result, result.original_text)
+    document = "你好 idea。你好 idea。"
+    repeated = list(converter.iter_document(document))
+    assert repeated[1].tokens[0].token.source_spans[0].start == 8
+    assert repeated[1].projections == repeated[0].projections
+    assert_projections_match_tokens(repeated[1], document)
@@ -311,6 +311,93 @@ def test_fallback_backend_uses_compatible_secondary_backend():
     assert result[0].units[0].native == "ni3"
 
 
+def test_fallback_backend_forwards_batches_and_retries_failed_requests():
+    class BatchFailingBackend(PypinyinBackend):
+        name = "batch-failing"
+
+        def __init__(self, converter):
+            super().__init__(converter=converter)
+            self.batches = []
+
+        def predict_batch(self, requests):
+            self.batches.append(len(requests))
+            if any(token.text == "坏" for request in requests for token in request.target_tokens):
+                raise BackendError("primary failed")
+            return super().predict_batch(requests)
+
+    primary = BatchFailingBackend(FakePinyinConverter({"你": "ni3", "坏": "huai4"}))
+    fallback = PypinyinBackend(converter=FakePinyinConverter({"你": "ni2", "坏": "huai4"}))
+    backend = FallbackBackend(primary, fallback)
+
+    healthy = backend.predict_batch([make_request("你", Language.CHINESE)] * 2)
+    mixed = backend.predict_batch([make_request("你", Language.CHINESE), make_request("坏", Language.CHINESE)])
+
+    assert [result[0].backend for result in healthy] == ["batch-failing", "batch-failing"]
+    assert [result[0].units[0].native for result in mixed] == ["ni3", "huai4"]
+    assert [result[0].backend for result in mixed] == ["batch-failing", "pypinyin"]
+    assert primary.batches == [2, 2, 1, 1]
+
+
+def test_builtin_backends_predict_batches_in_request_order():
+    converter = FakePinyinConverter({"你": "ni3", "好": "hao3"})
+    requests = [make_request(text, Language.CHINESE) for text in ("你好", "好", "你好")]
+
+    results = PypinyinBackend(converter=converter).predict_batch(requests)
+
+    assert converter.calls == ["你好", "好"]
+    assert [[unit.native for unit in result[0].units] for result in results] == [
+        ["ni3", "hao3"],
+        ["hao3"],
+        ["ni3", "hao3"],
+    ]
+
+
+def test_pypinyin_backend_memoizes_words_across_calls_with_the_caller_spans():
+    converter = FakePinyinConverter({"你": "ni3", "好": "hao3"})
+    backend = PypinyinBackend(converter=converter, memo_size=8)
+
+    first = backend.predict(make_request("你好", Language.CHINESE))
+    shifted = backend.predict(make_request("a 你好", Language.CHINESE))
+    token_id, pronunciation = next(iter(shifted.items()))
+
+    assert converter.calls == ["你好"]
+    assert backend._memo.info().hits == 1
+    assert pronunciation.token_id == token_id
+    assert [unit.native for unit in pronunciation.units] == [unit.native for unit in first[0].units]
+    assert [(span.start, span.end) for unit in pronunciation.units for span in unit.source_spans] == [(2, 3), (3, 4)]
+
+    unmemoized = PypinyinBackend(converter=FakePinyinConverter({"你": "ni3", "好": "hao3"}))
+    assert unmemoized._memo.info().maxsize == 0
+    assert PyCantoneseBackend()._memo.info().maxsize == 0
+    unmemoized.predict(make_request("你好", Language.CHINESE))
+    unmemoized.predict(make_request("你好", Language.CHINESE))
+    assert unmemoized._converter.calls == ["你好", "你好"]
+
+
+def test_g2pw_backend_runs_the_model_once_per_batch():
+    class BatchConverter:
+        def __init__(self):
+            self.calls = []
+
+        def __call__(self, sentences):
+            self.calls.append(sentences)
+            return [["ni3" if char == "你" else "hao3" for char in sentence] for sentence in sentences]
+
+    converter = BatchConverter()
+    backend = G2PWBackend(converter=converter)
+    requests = [make_request(text, Language.CHINESE) for text in ("你好", "好 idea 你")]
+
+    results = backend.predict_batch(requests)
+
+    assert converter.calls == [["你好", "好，你"]]
+    assert [unit.native for unit in results[0][0].units] == ["ni3", "hao3"]
+    assert [[unit.native for unit in pronunciation.units] for pronunciation in results[1].values()] == [
+        ["hao3"],
+        ["ni3"],
+    ]
+    assert backend.predict_batch([]) == []
+
+
 def test_english_backend_decision_tree_is_dependency_injectable():
     dictionary = {
         "a": [["AH0"], ["EY1"]],
@@ -1,11 +1,13 @@
 import json
+import random
+from difflib import SequenceMatcher
 from pathlib import Path
 
 import pytest
 
 from g2p_mix import G2P
 from g2p_mix.errors import NormalizationError
-from g2p_mix.models import Language, NormalizedText
+from g2p_mix.models import Language, NormalizedText, SourceMap, Span
 from g2p_mix.text import (
     AsciiLatinValidator,
     NormalizationPipeline,
@@ -31,6 +33,14 @@ def test_wetext_normalization_preserves_source_alignment(case):
     assert [(span.start, span.end) for span in result.char_sources] == [tuple(span) for span in case["source_spans"]]
 
 
+@pytest.mark.parametrize("case", cases("normalization"))
+def test_windowed_wetext_normalization_matches_whole_text_normalization(case):
+    result = WeTextNormalizer(windowed=True).normalize(NormalizedText.identity(case["text"]))
+
+    assert result.text == case["normalized"]
+    assert [(span.start, span.end) for span in result.char_sources] == [tuple(span) for span in case["source_spans"]]
+
+
 @pytest.mark.parametrize("case", cases("unicode_compatibility"))
 def test_unicode_compatibility_normalization_preserves_source_alignment(case):
     result = UnicodeCompatibilityNormalizer().normalize(NormalizedText.identity(case["text"]))
@@ -95,3 +105,143 @@ def test_traditional_chinese_failure_uses_the_normalization_error_boundary(case)
 
     with pytest.raises(NormalizationError, match=case["message"]):
         normalizer.normalize(NormalizedText.identity(case["text"]))
+
+
+def _sequence_matcher_sources(value, converted):
+    sources = []
+    matcher = SequenceMatcher(a=value.text, b=converted, autojunk=False)
+    for operation, source_start, source_end, target_start, target_end in matcher.get_opcodes():
+        if operation == "equal":
+            sources.extend(value.char_sources[source_start:source_end])
+        elif operation != "delete":
+            changed = (
+                value.char_sources[source_start:source_end]
+                or value.char_sources[max(0, source_start - 1) : source_start + 1]
+            )
+            span = Span(min(source.start for source in changed), max(source.end for source in changed))
+            sources.extend(span for _ in range(target_start, target_end))
+    return tuple(sources)
+
+
+class ReplacingNormalizer:
+    def normalize(self, text):
+        return text.replace("2026年", "二零二六年").replace("25°C", "二十五摄氏度").replace("1.0", "一点零")
+
+
+class EditingNormalizer:
+    def __init__(self, seed):
+        self._random = random.Random(seed)
+
+    def normalize(self, text):
+        edited = list(text)
+        for _ in range(self._random.randrange(1, 4)):
+            position = self._random.randrange(len(edited) + 1)
+            edited[position : position + self._random.randrange(3)] = self._random.choice(["一二三", "x", "", "四五"])
+        return "".join(edited)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_alignment_matches_a_whole_text_diff_for_arbitrary_edits_of_sentences(seed):
+    generator = random.Random(seed)
+    text = "".join(generator.choice("abcd一二 ") for _ in range(generator.randrange(1, 120)))
+    value = NormalizedText.identity(text)
+
+    result = WeTextNormalizer(EditingNormalizer(seed)).normalize(value)
+
+    assert result.char_sources == _sequence_matcher_sources(value, result.text)
+
+
+def test_windowed_alignment_matches_a_whole_text_diff_on_long_input():
+    text = "我们在2026年发布了版本1.0，气温25°C。" * 40 + "2026年"
+    value = NormalizedText.identity(text)
+
+    result = WeTextNormalizer(ReplacingNormalizer()).normalize(value)
+
+    assert result.text == ReplacingNormalizer().normalize(text)
+    assert result.char_sources == _sequence_matcher_sources(value, result.text)
+
+
+class RecordingNormalizer:
+    def __init__(self):
+        self.calls = []
+
+    def normalize(self, text, **options):
+        self.calls.append((text, options))
+        return text.replace("3", "三").replace("$5", "五美元")
+
+
+def test_windowed_wetext_normalization_sends_only_candidate_clauses():
+    recorder = RecordingNormalizer()
+    text = " 你好，世界。我有3个苹果，  价格是$5！再见 "
+    value = NormalizedText.identity(text)
+
+    result = WeTextNormalizer(recorder, windowed=True).normalize(value)
+
+    assert recorder.calls == [("我有3个苹果，", {"lang": "zh"}), ("价格是$5！", {"lang": "zh"})]
+    assert result.text == "你好，世界。我有三个苹果，  价格是五美元！再见"
+    assert result.char_sources == _sequence_matcher_sources(value, result.text)
+
+
+def test_windowed_wetext_normalization_skips_text_without_candidates():
+    recorder = RecordingNormalizer()
+    value = NormalizedText.identity("你好，世界。")
+
+    assert WeTextNormalizer(recorder, windowed=True).normalize(value) is value
+    assert recorder.calls == []
+
+
+def test_source_map_keeps_span_views_over_offset_arrays():
+    value = NormalizedText.identity("版本1.0")
+    spans = tuple(Span(index, index + 1) for index in range(5))
+
+    assert isinstance(value.char_sources, SourceMap)
+    assert value.char_sources == spans
+    assert value == NormalizedText("版本1.0", "版本1.0", spans)
+    assert value.char_sources[2:4] == SourceMap(spans[2:4])
+    assert value.char_sources[-1] == Span(4, 5)
+    assert value.sources_for(Span(1, 3)) == (Span(1, 2), Span(2, 3))
+    assert value.char_sources.cover(1, 4) == Span(1, 4)
+    assert value.char_sources.cover(2, 2) is None
+
+
+def test_source_map_concatenates_and_hashes_like_a_tuple():
+    sources = NormalizedText.identity("abcd").char_sources
+    spans = tuple(sources)
+
+    assert sources[:1] + sources[3:] == spans[:1] + spans[3:]
+    assert sources + (Span(0, 1),) == spans + (Span(0, 1),)
+    assert [Span(0, 1)] + sources == (Span(0, 1),) + spans
+    assert hash(sources) == hash(spans)
+    assert {spans: "spans"}[sources] == "spans"
+
+
+@pytest.mark.parametrize("text", ["I have 3 apples.", "你好，世界。", "café"])
+def test_unicode_compatibility_normalization_returns_stable_text_unchanged(text):
+    value = NormalizedText.identity(text)
+
+    assert UnicodeCompatibilityNormalizer().normalize(value) is value
+
+
+def test_unicode_compatibility_table_expands_characters_onto_their_source():
+    result = UnicodeCompatibilityNormalizer().normalize(NormalizedText.identity("ﬁｎｅ½"))
+
+    assert result.text == "fine1⁄2"
+    assert [(span.start, span.end) for span in result.char_sources] == [
+        (0, 1),
+        (0, 1),
+        (1, 2),
+        (2, 3),
+        (3, 4),
+        (3, 4),
+        (3, 4),
+    ]
+
+
+def test_wetext_alignment_matches_a_whole_text_diff_above_the_exact_limit():
+    text = "我们在2026年7月28日发布了版本1.0，价格是$5，气温25°C，比例50%，10:30见。I have 3 apples. " * 6
+    value = NormalizedText.identity(text)
+
+    result = WeTextNormalizer().normalize(value)
+
+    assert len(text) > 256
+    assert result.char_sources == _sequence_matcher_sources(value, result.text)
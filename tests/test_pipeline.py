@@ -1,11 +1,17 @@
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import pytest
 
 from g2p_mix.backends.base import BackendCapabilities
-from g2p_mix.errors import AlignmentError, ConfigurationError
+from g2p_mix.errors import AlignmentError, BackendError, ConfigurationError
+from g2p_mix.instrumentation import StageTimingCollector
 from g2p_mix.models import (
     ChineseDialect,
+    Deferred,
     Language,
     PhoneAlphabet,
     Pronunciation,
@@ -14,7 +20,9 @@ from g2p_mix.models import (
 from g2p_mix.pipeline import G2PPipeline
 from g2p_mix.profiles import ChineseProfile, EnglishProfile
 from g2p_mix.renderers import NativeRenderer
+from g2p_mix.resources import LoadState, ResourceLoader
 from g2p_mix.text import IdentityNormalizer
+from g2p_mix.validation import ValidationStats
 
 
 class WholeChineseSegmenter:
@@ -70,7 +78,7 @@ class RecordingBackend:
         return result
 
 
-def make_pipeline(chinese_backend, english_backend):
+def make_pipeline(chinese_backend, english_backend, **options):
     chinese = ChineseProfile(
         dialect=ChineseDialect.MANDARIN,
         backend=chinese_backend,
@@ -81,6 +89,7 @@ def make_pipeline(chinese_backend, english_backend):
     return G2PPipeline(
         chinese=chinese,
         english=EnglishProfile(english_backend),
+        **options,
     )
 
 
@@ -201,3 +210,286 @@ def test_pipeline_validates_backend_coverage():
 
     with pytest.raises(AlignmentError, match="coverage mismatch"):
         make_pipeline(chinese, english)("中文")
+
+
+def test_sampled_validation_checks_one_conversion_in_each_interval():
+    chinese = RecordingBackend(
+        name="broken",
+        capabilities=BackendCapabilities(
+            language=Language.CHINESE,
+            alphabet=PhoneAlphabet.PINYIN,
+            dialect=ChineseDialect.MANDARIN,
+        ),
+        omit_last=True,
+    )
+    english = RecordingBackend(
+        name="en",
+        capabilities=BackendCapabilities(
+            language=Language.ENGLISH,
+            alphabet=PhoneAlphabet.ARPABET,
+        ),
+    )
+    sampled = make_pipeline(chinese, english, validation="sampled", validation_interval=3)
+
+    with pytest.raises(AlignmentError, match="coverage mismatch"):
+        sampled("中文")
+    assert sampled("中文").tokens[0].pronunciation is None
+    assert [isinstance(result, AlignmentError) for result in sampled.convert_batch(["中文"] * 4)] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert sampled.validation_stats() == ValidationStats(conversions=6, validated=2, violations=2)
+
+    unchecked = make_pipeline(chinese, english, validation="off")
+    unchecked("中文")
+    assert unchecked.validation_stats() == ValidationStats(conversions=1, validated=0, violations=0)
+    with pytest.raises(ConfigurationError, match="validation"):
+        make_pipeline(chinese, english, validation="sometimes")
+
+
+def test_stage_hook_reports_each_stage_and_component():
+    chinese = RecordingBackend(
+        name="zh-fake",
+        capabilities=BackendCapabilities(
+            language=Language.CHINESE,
+            alphabet=PhoneAlphabet.PINYIN,
+            dialect=ChineseDialect.MANDARIN,
+        ),
+    )
+    english = BatchRecordingBackend(
+        name="en-fake",
+        capabilities=BackendCapabilities(
+            language=Language.ENGLISH,
+            alphabet=PhoneAlphabet.ARPABET,
+        ),
+    )
+    timings = []
+    pipeline = make_pipeline(chinese, english, on_stage=timings.append)
+
+    pipeline("中文 test")
+
+    assert [(timing.stage, timing.component) for timing in timings] == [
+        ("normalize", "IdentityNormalizer"),
+        ("tokenize", "LosslessTokenizer"),
+        ("segment", "WholeChineseSegmenter"),
+        ("project", "ProjectionBuilder"),
+        ("predict", "zh-fake"),
+        ("validate", "zh-fake"),
+        ("predict", "en-fake"),
+        ("validate", "en-fake"),
+        ("render", "NativeRenderer"),
+    ]
+    assert all(timing.seconds >= 0 and timing.items == 1 for timing in timings)
+
+    collector = StageTimingCollector()
+    make_pipeline(chinese, english, on_stage=collector).convert_batch(["中文 test", "test", "中文"])
+    summary = collector.summary()
+    assert summary[("predict", "en-fake")].calls == 1
+    assert summary[("predict", "en-fake")].items == 2
+    assert summary[("normalize", "IdentityNormalizer")].calls == 3
+
+
+def test_projections_warnings_and_phones_are_computed_on_first_access():
+    chinese = RecordingBackend(
+        name="zh-fake",
+        capabilities=BackendCapabilities(
+            language=Language.CHINESE,
+            alphabet=PhoneAlphabet.PINYIN,
+            dialect=ChineseDialect.MANDARIN,
+        ),
+    )
+    english = RecordingBackend(
+        name="en-fake",
+        capabilities=BackendCapabilities(
+            language=Language.ENGLISH,
+            alphabet=PhoneAlphabet.ARPABET,
+        ),
+    )
+    result = make_pipeline(chinese, english)("中文 test")
+
+    assert all(isinstance(vars(result)[name], Deferred) for name in ("projections", "warnings", "phones"))
+
+    assert result.phones == ("n", "i3", "n", "i3", "T", "EH1", "S", "T")
+    assert result.phones is result.phones
+    assert result.units is result.units
+    assert result.warnings == ()
+    assert result.projections[Language.ENGLISH].text == "<ZH> test"
+
+    restored = pickle.loads(pickle.dumps(make_pipeline(chinese, english)("中文 test")))
+    assert restored == result
+    assert not any(isinstance(value, Deferred) for value in vars(restored).values())
+
+    timings = []
+    timed = make_pipeline(chinese, english, on_stage=timings.append)("中文 test")
+    assert [timing.stage for timing in timings].count("render") == 1
+    assert vars(timed)["phones"] == result.phones
+    timed.phones
+    assert [timing.stage for timing in timings].count("render") == 1
+
+
+def test_warmup_reports_each_resource_and_keeps_going_after_failures():
+    loaded = []
+
+    class WarmBackend(RecordingBackend):
+        def warmup_steps(self):
+            return (
+                ("model", lambda: loaded.append("model")),
+                ("broken", self._fail),
+                ("model", lambda: loaded.append("duplicate")),
+            )
+
+        @staticmethod
+        def _fail():
+            raise BackendError("model download failed")
+
+    chinese = WarmBackend(
+        name="zh-fake",
+        capabilities=BackendCapabilities(
+            language=Language.CHINESE,
+            alphabet=PhoneAlphabet.PINYIN,
+            dialect=ChineseDialect.MANDARIN,
+        ),
+    )
+    english = RecordingBackend(
+        name="en-fake",
+        capabilities=BackendCapabilities(
+            language=Language.ENGLISH,
+            alphabet=PhoneAlphabet.ARPABET,
+        ),
+    )
+
+    report = make_pipeline(chinese, english).warmup()
+
+    assert loaded == ["model"]
+    assert [(load.name, load.error) for load in report.resources] == [
+        ("model", None),
+        ("broken", "model download failed"),
+    ]
+    assert not report.ok
+    assert report.seconds == sum(load.seconds for load in report.resources)
+
+
+def test_resource_loader_joins_a_running_load_and_ignores_optional_failures():
+    release = threading.Event()
+    runs = []
+
+    def fail():
+        raise BackendError("tagger unavailable")
+
+    def steps():
+        runs.append(threading.current_thread().name)
+        return (("model", release.wait), ("tagger", fail, True))
+
+    loader = ResourceLoader(steps)
+    loader.start()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        joined = [executor.submit(loader.load) for _ in range(2)]
+        time.sleep(0.1)
+        assert loader.state is LoadState.LOADING
+        release.set()
+        reports = [future.result(timeout=30) for future in joined]
+
+    assert runs == ["g2p-mix-warmup"]
+    assert all(report is loader.report for report in reports)
+    assert loader.report.ok and not loader.report.complete
+    assert [(load.name, load.optional) for load in loader.report.resources] == [("model", False), ("tagger", True)]
+    assert loader.state is LoadState.READY
+
+
+@dataclass
+class RejectingBackend(RecordingBackend):
+    rejected: str = ""
+
+    def predict(self, request):
+        if any(token.text == self.rejected for token in request.target_tokens):
+            raise BackendError(f"cannot pronounce {self.rejected!r}")
+        return super().predict(request)
+
+
+def test_batch_conversion_matches_single_conversion_and_isolates_errors():
+    chinese = RejectingBackend(
+        name="zh-fake",
+        capabilities=BackendCapabilities(
+            language=Language.CHINESE,
+            alphabet=PhoneAlphabet.PINYIN,
+            dialect=ChineseDialect.MANDARIN,
+        ),
+        rejected="坏",
+    )
+    english = RecordingBackend(
+        name="en-fake",
+        capabilities=BackendCapabilities(
+            language=Language.ENGLISH,
+            alphabet=PhoneAlphabet.ARPABET,
+        ),
+    )
+    converter = make_pipeline(chinese, english)
+    texts = ["这个 make sense", "坏", "", "test 不错"]
+
+    results = converter.convert_batch(texts)
+
+    assert len(results) == len(texts)
+    assert isinstance(results[1], BackendError)
+    assert "cannot pronounce" in str(results[1])
+    assert chinese.calls == 2
+    assert english.calls == 2
+    for text, result in zip(texts[:1] + texts[2:], results[:1] + results[2:]):
+        assert result == converter(text)
+
+
+def test_batch_conversion_rejects_non_string_items():
+    chinese = RecordingBackend(
+        name="zh-fake",
+        capabilities=BackendCapabilities(
+            language=Language.CHINESE,
+            alphabet=PhoneAlphabet.PINYIN,
+            dialect=ChineseDialect.MANDARIN,
+        ),
+    )
+    english = RecordingBackend(
+        name="en-fake",
+        capabilities=BackendCapabilities(
+            language=Language.ENGLISH,
+            alphabet=PhoneAlphabet.ARPABET,
+        ),
+    )
+
+    with pytest.raises(TypeError, match="only strings"):
+        make_pipeline(chinese, english).convert_batch(["中文", None])
+
+
+@dataclass
+class BatchRecordingBackend(RecordingBackend):
+    batches: int = 0
+
+    def predict_batch(self, requests):
+        self.batches += 1
+        return [super(BatchRecordingBackend, self).predict(request) for request in requests]
+
+
+def test_batch_conversion_uses_backend_batch_entry_points():
+    chinese = BatchRecordingBackend(
+        name="zh-fake",
+        capabilities=BackendCapabilities(
+            language=Language.CHINESE,
+            alphabet=PhoneAlphabet.PINYIN,
+            dialect=ChineseDialect.MANDARIN,
+        ),
+    )
+    english = RecordingBackend(
+        name="en-fake",
+        capabilities=BackendCapabilities(
+            language=Language.ENGLISH,
+            alphabet=PhoneAlphabet.ARPABET,
+        ),
+    )
+    converter = make_pipeline(chinese, english)
+
+    results = converter.convert_batch(["中文", "test", "不错 test"])
+
+    assert chinese.batches == 1
+    assert chinese.calls == 2
+    assert english.calls == 2
+    assert results == [converter(text) for text in ("中文", "test", "不错 test")]
@@ -1,12 +1,18 @@
 import json
 import os
+import pickle
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
 from g2p_mix import resources
+from g2p_mix.backends import english
 
 CASE_FILE = Path(__file__).parent / "cases" / "resources.json"
 CASE_GROUPS = json.loads(CASE_FILE.read_text(encoding="utf-8"))
@@ -696,3 +702,58 @@ finally:
         "all_later_results_match": True,
         "later_add_call_count": 0,
     }
+
+
+def test_single_flight_loader_runs_once_for_concurrent_first_calls():
+    calls = []
+    barrier = threading.Barrier(8)
+
+    @resources.single_flight
+    @lru_cache(maxsize=1)
+    def load():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    def first_call():
+        barrier.wait()
+        return load()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loaded = list(executor.map(lambda _: first_call(), range(8)))
+
+    assert len(calls) == 1
+    assert all(value is loaded[0] for value in loaded)
+    assert load.cache_info().hits == 7
+    assert load() is loaded[0]
+    assert load.cache_info().hits == 7
+    load.cache_clear()
+    assert load() is not loaded[0]
+    assert len(calls) == 2
+    lock = pickle.loads(pickle.dumps(resources.InitializationLock()))
+    with lock:
+        pass
+
+
+def test_backend_lazy_converter_loads_once_under_concurrency(monkeypatch):
+
+    loads = []
+    barrier = threading.Barrier(8)
+
+    def slow_load():
+        loads.append(threading.get_ident())
+        time.sleep(0.05)
+        return lambda word: ["AH0"]
+
+    monkeypatch.setattr(english.G2pEnOovPredictor, "_load_predictor", staticmethod(slow_load))
+    predictor = english.G2pEnOovPredictor()
+
+    def first_call():
+        barrier.wait()
+        return predictor.predict("zzz")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: first_call(), range(8)))
+
+    assert len(loads) == 1
+    assert results == [["AH0"]] * 8
@@ -0,0 +1,61 @@
+import pytest
+
+from g2p_mix import G2P
+from g2p_mix.errors import ConfigurationError
+from g2p_mix.stream import G2PStream
+
+
+def test_stream_emits_confirmed_clauses_and_keeps_document_spans():
+    converter = G2P()
+    text = "你这个 idea，不太 make sense。版本1.0发布了，价格3,000元！好的"
+    stream = G2PStream(converter)
+
+    emitted = []
+    for char in text:
+        emitted.append(stream.feed(char))
+    results = [result for chunk in emitted for result in chunk]
+
+    assert emitted[text.index("，")] == []
+    assert [result.original_text for result in emitted[text.index("不")]] == ["你这个 idea，"]
+    assert stream.pending == "好的"
+
+    tail = stream.flush()
+    assert [result.original_text for result in tail] == ["好的"]
+    assert stream.pending == ""
+    assert stream.flush() == []
+
+    results += tail
+    whole = converter(text)
+    assert [result.original_text for result in results] == [
+        "你这个 idea，",
+        "不太 make sense。",
+        "版本1.0发布了，",
+        "价格3,000元！",
+        "好的",
+    ]
+    assert [phone for result in results for phone in result.phones] == list(whole.phones)
+    assert [unit.source_spans for result in results for unit in result.units] == [
+        unit.source_spans for unit in whole.units
+    ]
+
+
+def test_stream_rejects_non_string_chunks():
+    with pytest.raises(TypeError):
+        G2PStream(G2P()).feed(b"bytes")
+
+
+def test_convert_offsets_source_spans_into_the_document():
+    converter = G2P()
+    document = "前文。你好 idea"
+
+    result = converter.convert("你好 idea", offset=3)
+
+    assert result.original_text == "你好 idea"
+    assert result.phones == converter("你好 idea").phones
+    assert ["".join(span.slice(document) for span in unit.source_spans) for unit in result.units] == [
+        "你",
+        "好",
+        "idea",
+    ]
+    with pytest.raises(ConfigurationError):
+        converter.convert("你好", offset=-1)
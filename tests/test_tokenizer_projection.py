@@ -1,11 +1,21 @@
+import io
 import json
+import os
 from pathlib import Path
 
 import pytest
 
 from g2p_mix.lexicons import MandarinLexicon
 from g2p_mix.models import Language, NormalizedText, ProjectionKind
-from g2p_mix.text import LosslessTokenizer, ProjectionBuilder, TextAnalyzer
+from g2p_mix.text import (
+    LosslessTokenizer,
+    ProjectionBuilder,
+    TextAnalyzer,
+    document,
+    iter_sentences,
+    split_sentences,
+    unicode_script,
+)
 
 CASE_FILE = Path(__file__).parent / "cases" / "unicode_tokenization.json"
 CASE_GROUPS = json.loads(CASE_FILE.read_text(encoding="utf-8"))
@@ -101,6 +111,28 @@ def test_latin_classification_uses_versioned_script_data(case):
     assert token[0].language.value == case["language"]
 
 
+def test_script_classification_matches_the_vendored_ranges_at_every_boundary():
+    tables = (
+        (unicode_script.HAN, unicode_script.HAN_CODEPOINT_RANGES),
+        (unicode_script.LATIN, unicode_script.LATIN_CODEPOINT_RANGES),
+        (unicode_script.COMBINING_MARK, unicode_script.COMBINING_MARK_RANGES),
+    )
+    boundaries = sorted(
+        {codepoint for _, ranges in tables for start, end in ranges for codepoint in (start - 1, start, end, end + 1)}
+    )
+    expected = bytes(
+        next(
+            (code for code, ranges in tables if any(start <= codepoint <= end for start, end in ranges)),
+            unicode_script.OTHER,
+        )
+        for codepoint in boundaries
+    )
+
+    assert bytes(unicode_script.script_of(codepoint) for codepoint in boundaries) == expected
+    assert unicode_script.classify("".join(map(chr, boundaries))) == expected
+    assert unicode_script.classify("ab 1") == bytes((unicode_script.LATIN,) * 2 + (unicode_script.OTHER,) * 2)
+
+
 @pytest.mark.parametrize("case", cases("han_ranges"))
 def test_tokenizer_and_lexicon_share_current_han_ranges(case):
     boundaries = (chr(int(case["start"], 16)), chr(int(case["end"], 16)))
@@ -122,3 +154,59 @@ def test_tokenizer_and_lexicon_share_current_han_ranges(case):
         assert token[0].language is Language.SYMBOL
         with pytest.raises(ValueError, match="exactly one Han character"):
             lexicon.pronunciations(char)
+
+
+def test_document_sentences_are_lossless_and_offset_into_the_document(tmp_path, monkeypatch):
+    text = "版本1.0发布。你好 idea! Dr. Smith?? 下一句！！末尾"
+    expected = [
+        (0, "版本1.0发布。"),
+        (8, "你好 idea! "),
+        (17, "Dr. "),
+        (21, "Smith?? "),
+        (29, "下一句！！"),
+        (34, "末尾"),
+    ]
+    path = tmp_path / "chapter.txt"
+    path.write_text(text, encoding="utf-8")
+    monkeypatch.setattr(document, "_CHUNK_SIZE", 3)
+
+    assert list(split_sentences(text)) == expected
+    assert list(iter_sentences(path)) == expected
+    assert list(iter_sentences(io.StringIO(text))) == expected
+    assert list(iter_sentences(io.BytesIO(text.encode("utf-8")))) == expected
+    with path.open("rb") as file:
+        assert list(iter_sentences(file)) == expected
+        assert not file.closed
+
+    # Pipes report a size of 0, and a seeked file continues from its position.
+    read_end, write_end = os.pipe()
+    os.write(write_end, text.encode("utf-8"))
+    os.close(write_end)
+    with open(read_end, "rb") as pipe:
+        assert list(iter_sentences(pipe)) == expected
+    with path.open("rb") as file:
+        file.seek(len(expected[0][1].encode("utf-8")))
+        assert list(iter_sentences(file)) == [(offset - 8, sentence) for offset, sentence in expected[1:]]
+
+
+@pytest.mark.parametrize(
+    ("text", "sentences", "clauses"),
+    [
+        ("你好。Hello world。", ["你好。", "Hello world。"], ["你好。", "Hello world。"]),
+        ("他说：A计划，B计划。", ["他说：A计划，B计划。"], ["他说：", "A计划，", "B计划。"]),
+        ("第一，2号选手", ["第一，2号选手"], ["第一，", "2号选手"]),
+        (
+            "好。\u3000Fine.\u3000下一句",
+            ["好。\u3000", "Fine.\u3000", "下一句"],
+            ["好。\u3000", "Fine.\u3000", "下一句"],
+        ),
+        ("3,000 and 1.5. 好？.5", ["3,000 and 1.5. ", "好？", ".5"], ["3,000 and 1.5. ", "好？", ".5"]),
+    ],
+)
+def test_full_width_marks_split_before_ascii_text(tmp_path, text, sentences, clauses):
+    path = tmp_path / "mixed.txt"
+    path.write_text(text, encoding="utf-8")
+
+    assert [sentence for _, sentence in split_sentences(text)] == sentences
+    assert [sentence for _, sentence in iter_sentences(path)] == sentences
+    assert [clause for _, clause in document.split_text(text, document.CLAUSE_END)] == clauses